@@ -0,0 +1,6 @@
+"""
+Python package behind the Neural-Network-based Momentum Algotrader.
+
+The notebooks remain the reference for how the models were built; this package
+holds the pieces of that pipeline that need to run outside of a notebook.
+"""
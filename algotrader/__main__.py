@@ -0,0 +1,5 @@
+import sys
+
+from algotrader.cli import main
+
+sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Feature ablation and permutation importance.
+
+For every symbol in a ``FeatureStore`` (ideally written with
+NOTEBOOK_FEATURE_COLUMNS so the unused notebook indicators are included), a
+model built from a symbol's configuration is trained on the candidate features
+over the configured training window. Each feature is then scored two ways on
+the bars after the window:
+
+* permutation importance: the drop in accuracy and in strategy return when
+  that feature's column is shuffled, without retraining;
+* leave-one-feature-out: the same drops when the model is retrained without
+  that feature.
+
+Every (symbol, retrain) pair is an independent task on a process pool. A
+feature whose drops are all at or below zero is dead weight for both feature
+computation and inference. A model that predicts a single class scores the
+same whatever its inputs, so rows whose baseline or retrain predicts only one
+class are marked degenerate and left out of every verdict.
+"""
+
+### Required Libraries ###
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import VotingClassifier
+from sklearn.preprocessing import StandardScaler
+
+from algotrader.labels import label_name, return_name
+from algotrader.models import MODEL_CONFIGS, build_model, get_config, training_window
+from algotrader.store import FeatureStore
+
+DEFAULT_MODEL = "SPY"
+N_REPEATS = 5
+SCORES = ("accuracy", "strategy_return")
+
+
+### Model Evaluation ###
+def _seeded_model(model_symbol, seed):
+    """
+    The configured model with every MLP seeded, so that retrains differ only
+    by their features.
+    """
+    model = build_model(model_symbol)
+    members = [estimator for _, estimator in model.estimators] if isinstance(model, VotingClassifier) else [model]
+    for member in members:
+        member.set_params(random_state=seed)
+    return model
+
+
+def backtest_scores(predictions, y, returns):
+    """
+    Accuracy of the predictions and the compounded return of trading them,
+    as 'mlp returns' = predictions * 'Actual Returns' in the notebook, and
+    whether only a single class was predicted.
+    """
+    return {
+        "accuracy": float(np.mean(predictions == y)),
+        "strategy_return": float(np.prod(1 + predictions * returns) - 1),
+        "single_class": bool(np.unique(predictions).size < 2),
+    }
+
+
+def _load_split(store, symbol, model_symbol, target):
+    """
+    Training and test rows of a symbol, split at the end of the configured
+    training window, without the rows whose target or 1-bar return is NaN.
+    """
+    X, Y = store.read(symbol)
+    labeled = Y[[target, return_name(1)]].notna().all(axis=1)
+    X, Y = X[labeled], Y[labeled]
+    training_begin, training_end = training_window(model_symbol, X.index)
+    train = (X.index >= training_begin) & (X.index <= training_end)
+    test = X.index > training_end
+    return (
+        X[train], Y.loc[train, target].to_numpy(),
+        X[test], Y.loc[test, target].to_numpy(), Y.loc[test, return_name(1)].to_numpy(),
+    )
+
+
+def _fit(model_symbol, X_train, y_train, seed):
+    scaler = StandardScaler().fit(X_train) if get_config(model_symbol)["scaled"] else None
+    inputs = scaler.transform(X_train) if scaler is not None else X_train
+    return _seeded_model(model_symbol, seed).fit(inputs, y_train), scaler
+
+
+def _predict(model, scaler, X):
+    return model.predict(scaler.transform(X) if scaler is not None else X)
+
+
+### Worker Tasks ###
+def _evaluate_task(root, symbol, features, dropped, model_symbol, target, n_repeats, seed):
+    """
+    Trains on features minus dropped and scores the test period. For the full
+    feature set (dropped is None) the permutation importances are added.
+    """
+    store = FeatureStore(root)
+    X_train, y_train, X_test, y_test, returns = _load_split(store, symbol, model_symbol, target)
+    kept = [feature for feature in features if feature != dropped]
+    if len(X_train) == 0 or len(X_test) == 0:
+        return symbol, dropped, None, None
+
+    model, scaler = _fit(model_symbol, X_train[kept].to_numpy(), y_train, seed)
+    test_inputs = X_test[kept].to_numpy()
+    scores = backtest_scores(_predict(model, scaler, test_inputs), y_test, returns)
+    if dropped is not None:
+        return symbol, dropped, scores, None
+
+    rng = np.random.default_rng(seed)
+    permutation = {}
+    for column, feature in enumerate(kept):
+        repeats = []
+        for _ in range(n_repeats):
+            shuffled = test_inputs.copy()
+            shuffled[:, column] = rng.permutation(shuffled[:, column])
+            repeats.append(backtest_scores(_predict(model, scaler, shuffled), y_test, returns))
+        permutation[feature] = {key: float(np.mean([r[key] for r in repeats])) for key in SCORES}
+    return symbol, dropped, scores, permutation
+
+
+### Ablation ###
+def run_ablation(
+    store,
+    symbols=None,
+    features=None,
+    model_symbol=None,
+    horizon=1,
+    n_repeats=N_REPEATS,
+    processes=None,
+    seed=0,
+):
+    """
+    Permutation importance and leave-one-feature-out retrains for every
+    symbol, all as independent tasks on a process pool (processes=1 runs
+    inline). features defaults to every stored feature column; model_symbol
+    picks the MODEL_CONFIGS entry (architecture, scaling and training window)
+    and defaults to the symbol's own configuration, or SPY's.
+
+    Returns a DataFrame indexed by (symbol, feature) with the baseline scores,
+    per method how much accuracy and strategy return drop without the feature
+    (positive = the feature helps), and whether the baseline or the retrain
+    without the feature predicts a single class ('degenerate').
+    """
+    symbols = symbols if symbols is not None else store.symbols()
+    target = label_name(horizon)
+    tasks = []
+    for symbol in symbols:
+        symbol_features = features or store.meta(symbol)["features"]
+        config_symbol = model_symbol or (symbol if symbol.upper() in MODEL_CONFIGS else DEFAULT_MODEL)
+        for dropped in [None] + list(symbol_features):
+            tasks.append((store.root, symbol, symbol_features, dropped, config_symbol, target, n_repeats, seed))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        results = [_evaluate_task(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_evaluate_task, *zip(*tasks)))
+
+    baselines = {symbol: (scores, permutation) for symbol, dropped, scores, permutation in results if dropped is None}
+    retrained = {(symbol, dropped): scores for symbol, dropped, scores, _ in results if dropped is not None}
+
+    rows = []
+    for symbol, (baseline, permutation) in baselines.items():
+        if baseline is None:
+            continue
+        for feature, permuted in permutation.items():
+            without = retrained[(symbol, feature)]
+            rows.append({
+                "symbol": symbol,
+                "feature": feature,
+                "baseline_accuracy": baseline["accuracy"],
+                "baseline_return": baseline["strategy_return"],
+                "permutation_accuracy_drop": baseline["accuracy"] - permuted["accuracy"],
+                "permutation_return_drop": baseline["strategy_return"] - permuted["strategy_return"],
+                "dropout_accuracy_drop": baseline["accuracy"] - without["accuracy"],
+                "dropout_return_drop": baseline["strategy_return"] - without["strategy_return"],
+                "baseline_single_class": baseline["single_class"],
+                "retrain_single_class": without["single_class"],
+                "degenerate": baseline["single_class"] or without["single_class"],
+            })
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).set_index(["symbol", "feature"])
+
+
+def dead_features(results, tolerance=0.0):
+    """
+    Features whose average importance across symbols is at most tolerance
+    under every measure, over the rows that are not degenerate: candidates
+    to stop computing.
+    """
+    drops = results[~results["degenerate"]].filter(like="_drop").groupby(level="feature").mean()
+    return sorted(drops.index[(drops <= tolerance).all(axis=1)])
+
+
+def degenerate_symbols(results):
+    """
+    Symbols whose every row is degenerate (typically a baseline that predicts
+    a single class), so they say nothing about any feature.
+    """
+    degenerate = results["degenerate"].groupby(level="symbol").all()
+    return sorted(degenerate.index[degenerate])
+
+
+def feature_verdicts(results, tolerance=0.0):
+    """
+    'dead', 'useful' or 'degenerate' for every feature, one column per symbol
+    plus a 'pooled' column that matches dead_features.
+    """
+    dead = (results.filter(like="_drop") <= tolerance).all(axis=1)
+    verdicts = pd.Series(np.where(dead, "dead", "useful"), index=results.index).where(~results["degenerate"], "degenerate")
+    table = verdicts.unstack("symbol")
+    pooled_dead = set(dead_features(results, tolerance))
+    scored = set(results.index[~results["degenerate"]].get_level_values("feature"))
+    table["pooled"] = [
+        "dead" if feature in pooled_dead else "useful" if feature in scored else "degenerate" for feature in table.index
+    ]
+    return table
@@ -0,0 +1,48 @@
+"""
+Backtests of the stored models, following the last cells of each notebook
+section: go long for the next bar when the model predicts 1, so
+'mlp returns' = 'mlp predictions' * 'Actual Returns'.
+"""
+
+### Required Libraries ###
+import pandas as pd
+
+from algotrader.labels import return_name
+from algotrader.models import training_window
+from algotrader.registry import transform
+
+
+def strategy_returns(artifact, X, actual_returns):
+    """
+    Frame with the notebook columns 'Actual Returns', 'mlp predictions' and
+    'mlp returns' for the rows of X.
+    """
+    predictions = artifact["model"].predict(transform(artifact, X)) if len(X) else []
+    frame = pd.DataFrame({"Actual Returns": actual_returns.to_numpy(), "mlp predictions": predictions}, index=X.index)
+    frame["mlp returns"] = frame["mlp predictions"] * frame["Actual Returns"]
+    return frame
+
+
+def backtest_symbol(artifact, feature_store, start=None, end=None):
+    """
+    Out-of-sample backtest of a symbol's model over its stored features. By
+    default the test period starts after the configured training window. Rows
+    without a 1-bar return are skipped.
+    """
+    symbol = artifact["symbol"]
+    X, Y = feature_store.read(symbol, end=end)
+    labeled = Y[return_name(1)].notna()
+    X, Y = X[labeled], Y[labeled]
+    if start is None:
+        _, start = training_window(symbol, X.index)
+        X, Y = X[X.index > start], Y[Y.index > start]
+    else:
+        X, Y = X.loc[start:], Y.loc[start:]
+    return strategy_returns(artifact, X, Y[return_name(1)])
+
+
+def summarize(frame, columns=("Actual Returns", "mlp returns")):
+    """
+    Total compounded return of each column, as (1 + returns).cumprod() ends.
+    """
+    return {column: float((1 + frame[column]).prod() - 1) for column in columns}
@@ -0,0 +1,264 @@
+"""
+Command-line entry point for the trading pipeline:
+
+    python -m algotrader fetch     download bars into the bar store
+    python -m algotrader features  compute features and labels into the feature store
+    python -m algotrader train     train the per-symbol models into the model registry
+    python -m algotrader backtest  evaluate the stored models after their training window
+    python -m algotrader predict   predict the next bar from the latest bars
+    python -m algotrader ablate    measure how much each stored feature is worth
+    python -m algotrader report    chart the backtests of every symbol into an HTML report
+
+Only argparse is imported up front. pandas, scikit-learn, finta, dotenv and
+the Alpaca client are imported inside the subcommand that needs them, so the
+hourly predict job does not pay for matplotlib or the training code, and
+``--help`` returns immediately.
+"""
+
+### Required Libraries ###
+import argparse
+import sys
+
+DEFAULT_SYMBOLS = ["SPY", "AAPL", "EAST"]
+
+
+### Subcommands ###
+def fetch(args):
+    """
+    Downloads bars for each symbol and saves them to the bar store.
+    """
+    from algotrader.data import fetch_bars, get_client
+    from algotrader.store import BarStore
+
+    client = get_client(args.source)
+    store = BarStore(args.bar_store)
+    for symbol in args.symbols:
+        bars = fetch_bars(client, symbol, args.timeframe, start=args.start, end=args.end)
+        store.write(symbol, bars)
+        print(f"{symbol}: {len(bars)} bars")
+
+
+def features(args):
+    """
+    Computes features and multi-horizon labels from the stored bars.
+    """
+    from algotrader.features import FEATURE_COLUMNS, NOTEBOOK_FEATURE_COLUMNS
+    from algotrader.store import BarStore, FeatureStore, write_features
+
+    bar_store = BarStore(args.bar_store)
+    feature_store = FeatureStore(args.feature_store)
+    columns = NOTEBOOK_FEATURE_COLUMNS if args.all_indicators else FEATURE_COLUMNS
+    for symbol in args.symbols:
+        write_features(feature_store, symbol, bar_store.read(symbol), horizons=args.horizons, features=columns)
+        print(f"{symbol}: {feature_store.n_rows(symbol)} rows")
+
+
+def train(args):
+    """
+    Trains each symbol's model from the feature store and saves a new version.
+    """
+    from algotrader.labels import label_name
+    from algotrader.online import train_full
+    from algotrader.registry import ModelRegistry
+    from algotrader.store import FeatureStore
+    from algotrader.streaming import train_streaming
+
+    feature_store = FeatureStore(args.feature_store)
+    registry = ModelRegistry(args.models)
+    target = label_name(args.horizon)
+    for symbol in args.symbols:
+        if args.in_memory:
+            X, Y = feature_store.read(symbol)
+            artifact = train_full(symbol, X, Y[target])
+            report = {"rows": artifact["rows_seen"]}
+        else:
+            artifact, report = train_streaming(
+                feature_store, symbol, epochs=args.epochs, memory_limit_mb=args.memory_limit_mb, target=target
+            )
+        version = registry.save(artifact)
+        rate = f", {report['rows_per_second']:.0f} rows/s" if "rows_per_second" in report else ""
+        baseline = artifact["baseline_accuracy"]
+        accuracy = f", baseline accuracy {baseline:.3f}" if baseline is not None else ""
+        print(f"{symbol}: version {version}, {report['rows']} rows{rate}{accuracy}")
+
+
+def backtest(args):
+    """
+    Compounded actual vs strategy returns after each model's training window.
+    """
+    import pandas as pd
+
+    from algotrader.backtest import backtest_symbol, summarize
+    from algotrader.registry import ModelRegistry
+    from algotrader.store import FeatureStore
+
+    feature_store = FeatureStore(args.feature_store)
+    registry = ModelRegistry(args.models)
+    for symbol in args.symbols:
+        frame = backtest_symbol(registry.load(symbol), feature_store, start=args.start, end=args.end)
+        if frame.empty:
+            print(f"{symbol}: no stored bars after the training window")
+            continue
+        summary = summarize(frame)
+        print(
+            f"{symbol}: {len(frame)} bars, actual {summary['Actual Returns']:.2%}, "
+            f"mlp {summary['mlp returns']:.2%}"
+        )
+        if args.bootstrap:
+            from algotrader.stats import compare_strategy
+
+            with pd.option_context("display.width", 200, "display.max_columns", None):
+                print(compare_strategy(frame, n_resamples=args.bootstrap).round(4))
+
+
+def predict(args):
+    """
+    Fetches the most recent bars and predicts whether the next bar closes up.
+    """
+    import pandas as pd
+
+    from algotrader.data import fetch_bars, get_client
+    from algotrader.features import add_indicators
+    from algotrader.registry import ModelRegistry, transform
+
+    client = get_client(args.source)
+    registry = ModelRegistry(args.models)
+    start = (pd.Timestamp.now(tz="America/New_York") - pd.Timedelta(days=args.lookback_days)).strftime("%Y-%m-%d")
+    for symbol in args.symbols:
+        artifact = registry.load(symbol)
+        bars = add_indicators(fetch_bars(client, symbol, args.timeframe, start=start))
+        latest = bars[artifact["features"]].dropna().iloc[[-1]]
+        prediction = int(artifact["model"].predict(transform(artifact, latest))[0])
+        print(f"{symbol}: {latest.index[0]} -> {'up' if prediction == 1 else 'not up'} ({prediction})")
+
+
+def ablate(args):
+    """
+    Permutation importance and leave-one-feature-out retrains per symbol.
+    """
+    import pandas as pd
+
+    from algotrader.ablation import dead_features, degenerate_symbols, feature_verdicts, run_ablation
+    from algotrader.store import FeatureStore
+
+    results = run_ablation(
+        FeatureStore(args.feature_store), args.symbols, model_symbol=args.model,
+        horizon=args.horizon, n_repeats=args.repeats, processes=args.processes,
+    )
+    if results.empty:
+        print("No symbol has stored bars after its training window")
+        return
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(results.round(4))
+        print(feature_verdicts(results))
+    if args.output:
+        results.to_csv(args.output)
+    print(f"Single-class symbols (excluded): {', '.join(degenerate_symbols(results)) or 'none'}")
+    print(f"Dead features: {', '.join(dead_features(results)) or 'none'}")
+
+
+def report(args):
+    """
+    Renders downsampled equity and drawdown charts of each backtest into a report.
+    """
+    from algotrader.backtest import backtest_symbol
+    from algotrader.registry import ModelRegistry
+    from algotrader.report import write_report
+    from algotrader.store import FeatureStore
+
+    feature_store = FeatureStore(args.feature_store)
+    registry = ModelRegistry(args.models)
+    frames = {
+        symbol: backtest_symbol(registry.load(symbol), feature_store, start=args.start, end=args.end)
+        for symbol in args.symbols
+    }
+    for symbol in [symbol for symbol, frame in frames.items() if frame.empty]:
+        print(f"{symbol}: no stored bars after the training window")
+    path = write_report(frames, args.output, points=args.points, processes=args.processes)
+    print(f"Report written to {path}")
+
+
+### Argument Parsing ###
+def build_parser():
+    """
+    Argument parser with one subparser per pipeline stage.
+    """
+    parser = argparse.ArgumentParser(prog="algotrader", description="Neural-network momentum trading pipeline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(subparser, *stores):
+        subparser.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS, type=str.upper)
+        if "bars" in stores:
+            subparser.add_argument("--bar-store", default="bar_store")
+        if "features" in stores:
+            subparser.add_argument("--feature-store", default="feature_store")
+        if "models" in stores:
+            subparser.add_argument("--models", default="models")
+
+    fetch_parser = subparsers.add_parser("fetch", help=fetch.__doc__.strip())
+    add_common(fetch_parser, "bars")
+    fetch_parser.add_argument("--source", choices=["alpaca", "synthetic"], default=None)
+    fetch_parser.add_argument("--timeframe", default="1H")
+    fetch_parser.add_argument("--start", default="2013-01-01")
+    fetch_parser.add_argument("--end", default=None)
+    fetch_parser.set_defaults(handler=fetch)
+
+    features_parser = subparsers.add_parser("features", help=features.__doc__.strip())
+    add_common(features_parser, "bars", "features")
+    features_parser.add_argument("--horizons", nargs="+", type=int, default=[1, 4, 8, 24])
+    features_parser.add_argument("--all-indicators", action="store_true", help="Also store the unused notebook indicators.")
+    features_parser.set_defaults(handler=features)
+
+    train_parser = subparsers.add_parser("train", help=train.__doc__.strip())
+    add_common(train_parser, "features", "models")
+    train_parser.add_argument("--horizon", type=int, default=1)
+    train_parser.add_argument("--epochs", type=int, default=1)
+    train_parser.add_argument("--memory-limit-mb", type=float, default=256)
+    train_parser.add_argument("--in-memory", action="store_true", help="Fit on the full window in memory, as the notebooks do.")
+    train_parser.set_defaults(handler=train)
+
+    backtest_parser = subparsers.add_parser("backtest", help=backtest.__doc__.strip())
+    add_common(backtest_parser, "features", "models")
+    backtest_parser.add_argument("--start", default=None)
+    backtest_parser.add_argument("--end", default=None)
+    backtest_parser.add_argument(
+        "--bootstrap", type=int, default=0, metavar="N",
+        help="Also print block-bootstrap confidence intervals from N resamples.",
+    )
+    backtest_parser.set_defaults(handler=backtest)
+
+    predict_parser = subparsers.add_parser("predict", help=predict.__doc__.strip())
+    add_common(predict_parser, "models")
+    predict_parser.add_argument("--source", choices=["alpaca", "synthetic"], default=None)
+    predict_parser.add_argument("--timeframe", default="1H")
+    predict_parser.add_argument("--lookback-days", type=int, default=30)
+    predict_parser.set_defaults(handler=predict)
+
+    ablate_parser = subparsers.add_parser("ablate", help=ablate.__doc__.strip())
+    add_common(ablate_parser, "features")
+    ablate_parser.add_argument("--model", default=None, help="MODEL_CONFIGS entry to use (default: each symbol's own, or SPY).")
+    ablate_parser.add_argument("--horizon", type=int, default=1)
+    ablate_parser.add_argument("--repeats", type=int, default=5)
+    ablate_parser.add_argument("--processes", type=int, default=None)
+    ablate_parser.add_argument("--output", default=None, help="Write the results to this CSV file.")
+    ablate_parser.set_defaults(handler=ablate)
+
+    report_parser = subparsers.add_parser("report", help=report.__doc__.strip())
+    add_common(report_parser, "features", "models")
+    report_parser.add_argument("--start", default=None)
+    report_parser.add_argument("--end", default=None)
+    report_parser.add_argument("--points", type=int, default=1000, help="Points kept per curve after downsampling.")
+    report_parser.add_argument("--processes", type=int, default=None)
+    report_parser.add_argument("--output", default="reports", help="Directory for the charts and index.html.")
+    report_parser.set_defaults(handler=report)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
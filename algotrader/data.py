@@ -0,0 +1,55 @@
+"""
+Market-data access shared by the pipeline.
+
+``get_client`` returns either the Alpaca REST client configured from
+``api.env`` (as in the notebooks) or the offline ``SyntheticREST`` source;
+both answer ``get_bars(symbol, timeframe, start).df`` the same way.
+"""
+
+### Required Libraries ###
+import os
+
+import pandas as pd
+
+DATA_SOURCE_ENV = "ALGOTRADER_DATA_SOURCE"
+SEED_ENV = "ALGOTRADER_SYNTHETIC_SEED"
+
+
+### Functionality Helper Functions ###
+def get_client(source=None, env_file="api.env", seed=None):
+    """
+    Builds the market-data client. ``source`` is 'alpaca' or 'synthetic' and
+    defaults to the ALGOTRADER_DATA_SOURCE environment variable, then 'alpaca'.
+    """
+    source = (source or os.getenv(DATA_SOURCE_ENV) or "alpaca").lower()
+    if source == "synthetic":
+        from algotrader.synthetic import SyntheticREST
+
+        if seed is None:
+            seed = int(os.getenv(SEED_ENV, "0"))
+        return SyntheticREST(seed=seed)
+    if source != "alpaca":
+        raise ValueError(f"Unknown market-data source: {source!r}")
+
+    import alpaca_trade_api as tradeapi
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file)
+    alpaca_api_key = os.getenv("ALPACA_API_KEY")
+    alpaca_secret_key = os.getenv("ALPACA_SECRET_KEY")
+    return tradeapi.REST(alpaca_api_key, alpaca_secret_key, api_version="v2")
+
+
+def fetch_bars(client, symbol, timeframe="1H", start="2013-01-01", end=None):
+    """
+    Downloads bars for one symbol and adds the close-to-close 'delta' column
+    every notebook computes right after fetching.
+    """
+    start_date = pd.Timestamp(start, tz="America/New_York").isoformat()
+    end_date = pd.Timestamp(end, tz="America/New_York").isoformat() if end is not None else None
+    if end_date is None:
+        bars = client.get_bars(symbol, timeframe, start=start_date).df
+    else:
+        bars = client.get_bars(symbol, timeframe, start=start_date, end=end_date).df
+    bars["delta"] = bars["close"].diff()
+    return bars
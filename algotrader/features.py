@@ -0,0 +1,109 @@
+"""
+Feature engineering from Vishal-Algotrading.ipynb. add_indicators computes the
+columns the final models use (the bar vwap, ema-8/ema-13 and the 14-bar RSI);
+add_notebook_indicators adds the other indicators the notebook explored, so
+their value can be measured before they are dropped for good.
+"""
+
+### Required Libraries ###
+import numpy as np
+import pandas as pd
+from finta import TA
+
+EMA_PERIODS = (8, 13)
+RSI_PERIOD = 14
+SMA_PERIODS = (10, 50, 200)
+EXTRA_EMA_PERIODS = (3, 5)
+FEATURE_COLUMNS = ["vwap", "ema-8", "ema-13", "rsi"]
+NOTEBOOK_FEATURE_COLUMNS = FEATURE_COLUMNS + [
+    "sma-10", "sma-50", "sma-200", "ema-3", "ema-5", "Predicted-vwap", "rsi with sma predicted",
+]
+
+
+### Indicators ###
+def calculate_rsi(price_diff, n=RSI_PERIOD):
+    """
+    Vectorized version of the notebook's calculate_rsi: the RSI at bar i is
+    built from the mean gain and mean loss over the n previous deltas, and the
+    first n bars reuse the statistics of the first window.
+    """
+    diff = pd.Series(np.asarray(price_diff, dtype=float).ravel())
+    gains = diff.where(diff > 0, 0.0)
+    losses = diff.where(diff <= 0, 0.0)
+    up_mean = gains.rolling(n, min_periods=1).sum() / (diff > 0).astype(float).rolling(n, min_periods=1).sum()
+    down_mean = -losses.rolling(n, min_periods=1).sum() / (diff <= 0).astype(float).rolling(n, min_periods=1).sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = (100 - 100 / (1 + up_mean / down_mean)).to_numpy()
+
+    # rsi[i] uses deltas [i - n, i); rows before n use the first window.
+    shifted = np.empty(len(rsi))
+    if len(rsi) > n:
+        shifted[n:] = rsi[n - 1 : -1]
+    shifted[: min(n, len(rsi))] = rsi[min(n, len(rsi)) - 1] if len(rsi) else np.nan
+    return shifted
+
+
+def add_indicators(bars):
+    """
+    Adds the model input columns to a frame of bars (as returned by
+    fetch_bars): 'rsi', 'ema-8' and 'ema-13'. The 'vwap' column comes with the
+    bars themselves.
+    """
+    bars = bars.copy()
+    if "delta" not in bars:
+        bars["delta"] = bars["close"].diff()
+    bars["rsi"] = calculate_rsi(bars["delta"])
+    for period in EMA_PERIODS:
+        bars[f"ema-{period}"] = TA.EMA(bars, period=period)
+    return bars
+
+
+def add_notebook_indicators(bars):
+    """
+    add_indicators plus the unused notebook columns: sma-10/50/200 (with the
+    first period filled with its average, as in the notebook), ema-3/5, the
+    'Predicted-vwap' flag and the 'rsi with sma predicted' signal.
+    """
+    bars = add_indicators(bars)
+    for period in SMA_PERIODS:
+        sma = TA.SMA(bars, period=period)
+        sma.iloc[:period] = bars["close"].iloc[:period].mean()
+        bars[f"sma-{period}"] = sma
+    for period in EXTRA_EMA_PERIODS:
+        bars[f"ema-{period}"] = TA.EMA(bars, period=period)
+    bars["Predicted-vwap"] = np.where(bars["vwap"] >= bars["close"], 1, 0)
+    bars["rsi with sma predicted"] = np.where(
+        np.logical_and(bars["rsi"].diff() > 0, bars["sma-10"].diff() > 0), 1, 0
+    )
+    return bars
+
+
+### Targets ###
+def add_momentum_labels(bars, returns_column="Actual Returns"):
+    """
+    Adds the next-bar momentum target used by every model: 1 when the bar
+    closed higher than the previous one, 0 otherwise.
+    """
+    bars = bars.copy()
+    bars[returns_column] = bars["close"].pct_change()
+    bars["momentum predicted"] = np.where(bars[returns_column] > 0, 1, 0)
+    bars["momentum entry/exit"] = bars["momentum predicted"].diff()
+    return bars.dropna(subset=[returns_column])
+
+
+def make_dataset(bars, features, target="momentum predicted"):
+    """
+    Aligns features with the target the way the notebooks do with shift():
+    the features of bar t - 1 are used to predict the direction of bar t.
+    Returns (X, y) sharing one index.
+    """
+    X = bars[features].shift()
+    valid = X.notna().all(axis=1) & bars[target].notna()
+    return X[valid], bars.loc[valid, target]
+
+
+def build_dataset(bars, features):
+    """
+    Indicators, labels and aligned (X, y) for one symbol's raw bars.
+    """
+    return make_dataset(add_momentum_labels(add_indicators(bars)), features)
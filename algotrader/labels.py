@@ -0,0 +1,97 @@
+"""
+Multi-horizon momentum labels.
+
+The notebooks only label the next bar ('momentum predicted' = next return > 0)
+and line it up with the features through shift() and dropping rows by hand.
+Here every horizon and threshold is labeled at once from the close prices as
+one array, using the same convention as features.make_dataset: the row for
+bar t holds the features of bar t - 1, and the horizon-h label of that row is
+whether close[t - 1 + h] / close[t - 1] - 1 exceeds the threshold. Labels only
+look at closes after the bar whose features they are paired with, and rows
+whose horizon runs past the end of the data are left unlabeled (NaN).
+"""
+
+### Required Libraries ###
+import numpy as np
+import pandas as pd
+
+from algotrader.features import FEATURE_COLUMNS, add_indicators, add_notebook_indicators
+
+HORIZONS = (1, 4, 8, 24)
+THRESHOLDS = (0.0,)
+
+
+### Label Names ###
+def label_name(horizon, threshold=0.0):
+    """
+    Column name of a label, e.g. 'momentum +4 > 0' or 'momentum +24 > 0.01'.
+    """
+    return f"momentum +{horizon} > {threshold:g}"
+
+
+def return_name(horizon):
+    """
+    Column name of a forward return, e.g. 'return +4'.
+    """
+    return f"return +{horizon}"
+
+
+def label_names(horizons=HORIZONS, thresholds=THRESHOLDS):
+    """
+    Label column names in the order build_labels lays them out: horizon-major,
+    then threshold.
+    """
+    return [label_name(horizon, threshold) for horizon in horizons for threshold in thresholds]
+
+
+### Label Builders ###
+def forward_returns(close, horizons=HORIZONS):
+    """
+    (n, len(horizons)) array of forward returns: row t, column h holds
+    close[t - 1 + h] / close[t - 1] - 1, or NaN when that bar does not exist.
+    """
+    close = np.asarray(close, dtype=float)
+    n = len(close)
+    horizons = np.asarray(horizons)
+    rows = np.arange(n)[:, None]
+    base = rows - 1
+    target = base + horizons[None, :]
+    valid = (base >= 0) & (target < n)
+    returns = close[np.clip(target, 0, n - 1)] / close[np.clip(base, 0, n - 1)] - 1
+    return np.where(valid, returns, np.nan)
+
+
+def build_labels(close, horizons=HORIZONS, thresholds=THRESHOLDS):
+    """
+    (n, len(horizons) * len(thresholds)) array of 0/1 labels, NaN where the
+    horizon is not available, with columns ordered as label_names().
+    """
+    returns = forward_returns(close, horizons)
+    thresholds = np.asarray(thresholds, dtype=float)
+    labels = (returns[:, :, None] > thresholds[None, None, :]).astype(float)
+    labels[np.isnan(returns)] = np.nan
+    return labels.reshape(len(returns), -1)
+
+
+def make_labeled_dataset(bars, features, horizons=HORIZONS, thresholds=THRESHOLDS, dropna=False):
+    """
+    Computes the indicators once and returns (X, Y): X holds the features of
+    the previous bar, Y the labels for every horizon and threshold followed by
+    the forward returns. Rows missing any feature are dropped (the first bars).
+    Labels that are not available yet stay NaN, so a row is only lost for the
+    horizons that run past the last bar; with dropna, rows missing any label
+    are dropped as well, which removes the last max(horizons) - 1.
+    """
+    extended = any(feature not in FEATURE_COLUMNS for feature in features)
+    bars = add_notebook_indicators(bars) if extended else add_indicators(bars)
+    X = bars[features].shift()
+    close = bars["close"].to_numpy(dtype=float)
+    Y = pd.DataFrame(
+        np.hstack([build_labels(close, horizons, thresholds), forward_returns(close, horizons)]),
+        index=bars.index,
+        columns=label_names(horizons, thresholds) + [return_name(horizon) for horizon in horizons],
+    )
+    valid = X.notna().all(axis=1)
+    if dropna:
+        valid &= Y.notna().all(axis=1)
+    return X[valid], Y[valid]
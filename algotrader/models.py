@@ -0,0 +1,103 @@
+"""
+Per-symbol model configurations, matching the final cells of
+Vishal-Algotrading.ipynb: one MLP per risk tier, trained on a fixed window.
+"""
+
+### Required Libraries ###
+from pathlib import Path
+
+import joblib
+import pandas as pd
+from pandas.tseries.offsets import DateOffset
+from sklearn.ensemble import VotingClassifier
+from sklearn.neural_network import MLPClassifier
+
+NOTEBOOK_DIR = Path(__file__).resolve().parent.parent / "Vishal-Algotrading"
+
+MODEL_CONFIGS = {
+    "SPY": {
+        "risk_level": "low",
+        "features": ["vwap", "ema-8", "rsi"],
+        "scaled": False,
+        "training_begin": None,
+        "training_years": 9,
+        "model_file": "sp_mlp_model.pkl",
+    },
+    "AAPL": {
+        "risk_level": "medium",
+        "features": ["vwap", "ema-8", "rsi"],
+        "scaled": False,
+        "training_begin": "2021-01-01 12:00:00",
+        "training_years": 1,
+        "model_file": "apple_mlp_model.pkl",
+    },
+    "EAST": {
+        "risk_level": "high",
+        "features": ["vwap", "ema-13", "rsi"],
+        "scaled": True,
+        "training_begin": "2014-01-01 12:00:00",
+        "training_years": 6,
+        "model_file": "ensemble east_mlp_model.pkl",
+    },
+}
+
+
+### Functionality Helper Functions ###
+def get_config(symbol):
+    """
+    Configuration for a symbol, raising a readable error for unknown ones.
+    """
+    try:
+        return MODEL_CONFIGS[symbol.upper()]
+    except KeyError:
+        raise ValueError(f"No model configuration for symbol {symbol!r}") from None
+
+
+def build_model(symbol):
+    """
+    Unfitted estimator with the hyperparameters chosen in the notebook.
+    """
+    symbol = symbol.upper()
+    if symbol == "SPY":
+        return MLPClassifier(solver="adam", hidden_layer_sizes=(25, 4))
+    if symbol == "AAPL":
+        return MLPClassifier(solver="lbfgs", alpha=1e-5, hidden_layer_sizes=(15, 15), random_state=1)
+    if symbol == "EAST":
+        mlp_clf1 = MLPClassifier(solver="adam", alpha=1e-1, activation="tanh", hidden_layer_sizes=(5,))
+        mlp_clf2 = MLPClassifier(solver="sgd", alpha=1e-1, activation="relu", hidden_layer_sizes=(7,))
+        mlp_clf3 = MLPClassifier(solver="adam", alpha=1e-1, activation="logistic", hidden_layer_sizes=(20,))
+        return VotingClassifier(estimators=[("model1", mlp_clf1), ("model2", mlp_clf2), ("model3", mlp_clf3)])
+    raise ValueError(f"No model configuration for symbol {symbol!r}")
+
+
+def training_window(symbol, index):
+    """
+    (training_begin, training_end) for a symbol's feature index. A missing
+    training_begin means the start of the data, as for SPY.
+    """
+    config = get_config(symbol)
+    training_begin = config["training_begin"]
+    if training_begin is None:
+        training_begin = index.min()
+    else:
+        training_begin = _localize(training_begin, index)
+    training_end = training_begin + DateOffset(years=config["training_years"])
+    return training_begin, training_end
+
+
+def _localize(value, index):
+    """
+    Timestamp for value in the timezone of index, so it can slice it.
+    """
+    timestamp = pd.Timestamp(value)
+    tz = getattr(index, "tz", None)
+    if tz is not None and timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize(tz)
+    return timestamp
+
+
+def load_notebook_model(symbol):
+    """
+    Loads the pickled model saved by the notebook for a symbol.
+    """
+    return joblib.load(NOTEBOOK_DIR / get_config(symbol)["model_file"])
@@ -0,0 +1,198 @@
+"""
+Incremental model updates.
+
+Instead of refitting every MLPClassifier over years of bars whenever a new
+batch of hourly bars arrives, ``partial_update`` scores the current model on
+the new labeled bars (so the accuracy is out-of-sample), folds them into the
+running StandardScaler statistics and takes ``partial_fit`` steps on them.
+Accuracy over the last ``DRIFT_WINDOW_ROWS`` labeled bars is tracked against
+the baseline recorded at the last full retrain, and the report says when the
+drift is large enough that a full retrain (``train_full``) is worth it. ``ModelRegistry`` (from ``algotrader.registry``)
+keeps updated artifacts as numbered versions next to a JSON manifest; the
+hourly job keeps only the last ``KEEP_VERSIONS`` of them and the latest full
+retrain.
+"""
+
+### Required Libraries ###
+import numpy as np
+from sklearn.ensemble import VotingClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.preprocessing import StandardScaler
+
+from algotrader.features import build_dataset
+from algotrader.models import build_model, get_config, training_window
+from algotrader.registry import ModelRegistry, transform  # noqa: F401 (ModelRegistry is re-exported)
+
+STOCHASTIC_SOLVERS = ("sgd", "adam")
+DRIFT_TOLERANCE = 0.05
+DRIFT_WINDOW_ROWS = 300
+KEEP_VERSIONS = 24
+
+
+### Model Helpers ###
+def model_members(model):
+    """
+    The MLPs that actually get updated: the fitted members of a voting
+    ensemble, or the model itself.
+    """
+    if isinstance(model, VotingClassifier):
+        return list(model.estimators_)
+    return [model]
+
+
+def make_incremental(model):
+    """
+    Prepares a fitted model for partial_fit. lbfgs has no incremental mode,
+    so lbfgs-trained networks (the AAPL model) keep their weights and continue
+    with adam.
+    """
+    for member in model_members(model):
+        if member.solver not in STOCHASTIC_SOLVERS:
+            member.set_params(solver="adam")
+            member.loss_curve_ = [member.loss_]
+            member.best_loss_ = member.loss_
+            member._no_improvement_count = 0
+    return model
+
+
+def _encode_labels(model, y):
+    """
+    VotingClassifier trains its members on label-encoded targets.
+    """
+    if isinstance(model, VotingClassifier):
+        return model.le_.transform(y)
+    return np.asarray(y)
+
+
+### Artifacts ###
+def make_artifact(symbol, model, scaler, rows_seen, last_timestamp):
+    """
+    Wraps a fitted model with everything needed to keep updating it: the
+    running scaler, the baseline out-of-sample accuracy, whether each of the
+    most recent updated bars was predicted correctly, and bookkeeping.
+    """
+    config = get_config(symbol)
+    return {
+        "symbol": symbol.upper(),
+        "features": list(config["features"]),
+        "scaled": config["scaled"],
+        "model": make_incremental(model),
+        "scaler": scaler,
+        "rows_seen": rows_seen,
+        "last_timestamp": last_timestamp,
+        "baseline_accuracy": None,
+        "recent_hits": np.zeros(0, dtype=bool),
+    }
+
+
+def new_artifact(symbol, model, X_train, y_train, X_test=None, y_test=None):
+    """
+    Artifact for a model fitted in memory on X_train; X_test, when given,
+    sets the baseline accuracy.
+    """
+    features = get_config(symbol)["features"]
+    scaler = StandardScaler().partial_fit(X_train[features].to_numpy(dtype=float))
+    artifact = make_artifact(symbol, model, scaler, len(X_train), X_train.index.max())
+    if X_test is not None and len(X_test):
+        artifact["baseline_accuracy"] = float(accuracy_score(y_test, model.predict(transform(artifact, X_test))))
+        artifact["last_timestamp"] = max(artifact["last_timestamp"], X_test.index.max())
+    return artifact
+
+
+def train_full(symbol, X, y):
+    """
+    Full retrain over the symbol's configured training window; the bars after
+    the window (index > training_end, as in backtest_symbol) give the baseline
+    accuracy that later updates are compared to.
+    Rows without a label (NaN) are skipped.
+    """
+    config = get_config(symbol)
+    labeled = y.notna()
+    X, y = X[labeled], y[labeled]
+    training_begin, training_end = training_window(symbol, X.index)
+    X_train, y_train = X.loc[training_begin:training_end], y.loc[training_begin:training_end]
+    X_test, y_test = X[X.index > training_end], y[y.index > training_end]
+
+    inputs = X_train[config["features"]].to_numpy(dtype=float)
+    if config["scaled"]:
+        inputs = StandardScaler().fit_transform(inputs)
+    model = build_model(symbol).fit(inputs, y_train)
+    return new_artifact(symbol, model, X_train, y_train, X_test, y_test)
+
+
+### Incremental Updates ###
+def partial_update(artifact, X_new, y_new, drift_tolerance=DRIFT_TOLERANCE, window=DRIFT_WINDOW_ROWS):
+    """
+    Updates an artifact in place with newly arrived labeled bars and returns a
+    report of the batch accuracy, the accuracy over the last `window` labeled
+    bars, its drift from the baseline and whether a full retrain is
+    recommended. The hourly job usually sends a single bar, so the drift is
+    only judged once `window` bars have been scored since the last full
+    retrain; until then recent_accuracy covers the bars seen so far and
+    needs_retrain stays False.
+    """
+    if len(X_new) == 0:
+        raise ValueError("partial_update needs at least one new labeled bar")
+    model = artifact["model"]
+
+    hits = model.predict(transform(artifact, X_new)) == np.asarray(y_new)
+    accuracy = float(hits.mean())
+    artifact["scaler"].partial_fit(X_new[artifact["features"]].to_numpy(dtype=float))
+    inputs = transform(artifact, X_new)
+    targets = _encode_labels(model, y_new)
+    for member in model_members(model):
+        member.partial_fit(inputs, targets)
+
+    artifact["rows_seen"] += len(X_new)
+    artifact["last_timestamp"] = X_new.index.max()
+    artifact["recent_hits"] = np.concatenate([artifact["recent_hits"], hits])[-window:]
+    recent_rows = len(artifact["recent_hits"])
+    recent_accuracy = float(artifact["recent_hits"].mean())
+    judged = recent_rows >= window
+    if artifact["baseline_accuracy"] is None and judged:
+        # No out-of-sample bars at training time: the first full window
+        # becomes the baseline.
+        artifact["baseline_accuracy"] = recent_accuracy
+
+    baseline_accuracy = artifact["baseline_accuracy"]
+    drift = baseline_accuracy - recent_accuracy if baseline_accuracy is not None else None
+    return {
+        "symbol": artifact["symbol"],
+        "rows": len(X_new),
+        "rows_seen": artifact["rows_seen"],
+        "accuracy": accuracy,
+        "recent_rows": recent_rows,
+        "recent_accuracy": recent_accuracy,
+        "baseline_accuracy": baseline_accuracy,
+        "drift": drift,
+        "needs_retrain": judged and drift > drift_tolerance,
+    }
+
+
+def new_rows(artifact, X, y):
+    """
+    The rows of (X, y) the artifact has not been trained or evaluated on yet.
+    """
+    last_timestamp = artifact["last_timestamp"]
+    if last_timestamp is None:
+        return X, y
+    mask = X.index > last_timestamp
+    return X[mask], y[mask]
+
+
+def update_from_bars(registry, symbol, bars, drift_tolerance=DRIFT_TOLERANCE, keep=KEEP_VERSIONS):
+    """
+    Hourly job: builds features for the latest bars (which must include enough
+    history for the indicators to warm up), applies only the bars newer than
+    the stored model and saves the result as a new version, keeping the last
+    `keep` versions and the latest full retrain (keep=None keeps them all).
+    Returns the report, or None when there was nothing new.
+    """
+    artifact = registry.load(symbol)
+    X, y = build_dataset(bars, artifact["features"])
+    X_new, y_new = new_rows(artifact, X, y)
+    if len(X_new) == 0:
+        return None
+    report = partial_update(artifact, X_new, y_new, drift_tolerance=drift_tolerance)
+    report["version"] = registry.save(artifact, report, keep=keep)
+    return report
@@ -0,0 +1,116 @@
+"""
+Versioned model artifacts and the model inputs they expect.
+
+Everything the hourly predict job needs to load a stored model and turn
+features into its inputs, kept apart from ``algotrader.online`` so that
+predicting does not import the training code (scikit-learn's ensembles and
+metrics, the model configurations). Unpickling an artifact still imports the
+scikit-learn estimators it contains.
+"""
+
+### Required Libraries ###
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import joblib
+
+
+### Model Inputs ###
+def transform(artifact, X):
+    """
+    Model inputs for X: the configured feature columns, standardized with the
+    running scaler when the symbol's model was trained on scaled data.
+    """
+    values = X[artifact["features"]].to_numpy(dtype=float)
+    if artifact["scaled"]:
+        return artifact["scaler"].transform(values)
+    return values
+
+
+### Versioned Storage ###
+class ModelRegistry:
+    """
+    Versioned model artifacts on disk:
+
+        <root>/<SYMBOL>/v0001.pkl, v0002.pkl, ...
+        <root>/<SYMBOL>/manifest.json
+    """
+
+    def __init__(self, root="models"):
+        self.root = Path(root)
+
+    def _manifest_path(self, symbol):
+        return self.root / symbol.upper() / "manifest.json"
+
+    def versions(self, symbol):
+        """
+        Manifest entries for a symbol, oldest first.
+        """
+        path = self._manifest_path(symbol)
+        if not path.exists():
+            return []
+        return json.loads(path.read_text())
+
+    def save(self, artifact, report=None, keep=None):
+        """
+        Stores an artifact as the next version and records it in the manifest.
+        Versions saved with an update report are incremental updates, the others
+        full retrains. With keep, only the last `keep` versions and the latest
+        full retrain are kept; older files are deleted and dropped from the
+        manifest.
+        """
+        symbol = artifact["symbol"]
+        versions = self.versions(symbol)
+        version = versions[-1]["version"] + 1 if versions else 1
+        directory = self.root / symbol
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = f"v{version:04d}.pkl"
+        joblib.dump(artifact, directory / filename)
+
+        entry = {
+            "version": version,
+            "file": filename,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "parent": versions[-1]["version"] if versions else None,
+            "kind": "full" if report is None else "update",
+            "rows_seen": artifact["rows_seen"],
+            "last_timestamp": str(artifact["last_timestamp"]),
+            "baseline_accuracy": artifact["baseline_accuracy"],
+        }
+        if report is not None:
+            entry.update({key: report[key] for key in ("accuracy", "recent_accuracy", "drift", "needs_retrain")})
+        versions.append(entry)
+
+        removed = []
+        if keep is not None:
+            full = [entry["version"] for entry in versions if entry.get("kind") == "full"]
+            kept = {entry["version"] for entry in versions[-keep:]} | set(full[-1:])
+            removed = [entry for entry in versions if entry["version"] not in kept]
+            versions = [entry for entry in versions if entry["version"] in kept]
+
+        manifest = self._manifest_path(symbol)
+        temporary = manifest.with_suffix(".json.tmp")
+        temporary.write_text(json.dumps(versions, indent=2))
+        os.replace(temporary, manifest)
+        # Files go only once the manifest no longer points at them.
+        for entry in removed:
+            (directory / entry["file"]).unlink(missing_ok=True)
+        return version
+
+    def load(self, symbol, version=None):
+        """
+        Loads a stored artifact, the latest one unless a version is given.
+        """
+        versions = self.versions(symbol)
+        if not versions:
+            raise FileNotFoundError(f"No stored models for {symbol.upper()} under {self.root}")
+        if version is None:
+            entry = versions[-1]
+        else:
+            matches = [entry for entry in versions if entry["version"] == version]
+            if not matches:
+                raise FileNotFoundError(f"{symbol.upper()} has no model version {version}")
+            entry = matches[0]
+        return joblib.load(self.root / symbol.upper() / entry["file"])
@@ -0,0 +1,185 @@
+"""
+Backtest charts and the multi-symbol report.
+
+The notebooks plot ``(1 + historical_data_copy[['Actual Returns', 'mlp returns']]).cumprod()``
+at full resolution and save it as a PNG, which pushes every hourly bar through
+matplotlib. Here the equity and drawdown curves are first reduced to at most
+``points`` bars per series with Largest-Triangle-Three-Buckets (LTTB), which
+keeps the peaks, troughs and turns that the eye sees, so the rendering cost no
+longer grows with the length of the backtest. Per-symbol charts are rendered
+on a process pool and collected into an HTML report.
+"""
+
+### Required Libraries ###
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algotrader.backtest import summarize
+
+POINTS = 1000
+SERIES = ("Actual Returns", "mlp returns")
+FIGSIZE = (10, 6)
+DPI = 100
+
+
+### Downsampling ###
+def lttb(x, y, points=POINTS):
+    """
+    Indices of the points that Largest-Triangle-Three-Buckets keeps out of
+    (x, y). The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the point kept
+    before it and the average of the next bucket.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if points >= n or points < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    counts = np.diff(np.append(edges, n))
+    mean_x = np.add.reduceat(x, edges) / counts
+    mean_y = np.add.reduceat(y, edges) / counts
+
+    kept = np.empty(points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(points - 2):
+        low, high = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[previous] - mean_x[bucket + 1]) * (y[low:high] - y[previous])
+            - (x[previous] - x[low:high]) * (mean_y[bucket + 1] - y[previous])
+        )
+        previous = low + int(np.argmax(area))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def curves(frame, columns=SERIES):
+    """
+    Equity ((1 + returns).cumprod(), as in the notebooks) and drawdown from
+    the running peak for each returns column of a backtest frame.
+    """
+    equity = (1 + frame[list(columns)].fillna(0)).cumprod()
+    return equity, equity / equity.cummax() - 1
+
+
+def downsample(frame, points=POINTS, columns=SERIES):
+    """
+    LTTB-reduced equity and drawdown curves of a backtest frame:
+    {'equity' | 'drawdown': {column: (timestamps, values)}}.
+    """
+    equity, drawdown = curves(frame, columns)
+    x = frame.index.values.astype("datetime64[ns]").view(np.int64)
+    reduced = {}
+    for name, table in (("equity", equity), ("drawdown", drawdown)):
+        reduced[name] = {}
+        for column in columns:
+            values = table[column].to_numpy(dtype=float)
+            kept = lttb(x, values, points)
+            reduced[name][column] = (frame.index.values[kept], values[kept])
+    return reduced
+
+
+### Rendering ###
+def render_chart(symbol, reduced, path):
+    """
+    Saves the equity curves above the drawdowns of one symbol as a PNG.
+    matplotlib is imported here, so worker processes and the command line only
+    pay for it when drawing, and the figure is drawn on its own Agg canvas
+    rather than through pyplot, leaving the caller's backend (e.g. a
+    notebook's) untouched.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    top, bottom = fig.subplots(2, 1, sharex=True, gridspec_kw={"height_ratios": [2, 1]})
+    for column, (x, y) in reduced["equity"].items():
+        top.plot(x, y, label=column, linewidth=1)
+    for column, (x, y) in reduced["drawdown"].items():
+        bottom.plot(x, y, label=column, linewidth=1)
+    top.set_title(f"{symbol} mlp vs actual returns")
+    top.set_ylabel("Growth of $1")
+    top.legend()
+    bottom.set_ylabel("Drawdown")
+    bottom.set_xlabel("Date")
+    fig.tight_layout()
+    fig.savefig(path, dpi=DPI)
+    return str(path)
+
+
+def _render_task(symbol, reduced, path):
+    return symbol, render_chart(symbol, reduced, path)
+
+
+def render_charts(frames, out_dir="reports", points=POINTS, processes=None):
+    """
+    Downsamples and renders one chart per symbol into out_dir, on a pool of
+    processes (processes=1 runs inline). Only the reduced curves are sent to
+    the workers. Returns {symbol: path}.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(symbol, downsample(frame, points), out_dir / f"{symbol}.png") for symbol, frame in frames.items()]
+
+    processes = min(processes or os.cpu_count() or 1, max(len(tasks), 1))
+    if processes == 1:
+        results = [_render_task(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_render_task, *zip(*tasks)))
+    return dict(results)
+
+
+### Report ###
+def summary_table(frames, columns=SERIES):
+    """
+    One row per symbol: bars, total compounded return and maximum drawdown of
+    each returns column.
+    """
+    rows = []
+    for symbol, frame in frames.items():
+        _, drawdown = curves(frame, columns)
+        totals = summarize(frame, columns)
+        row = {"symbol": symbol, "bars": len(frame), "start": frame.index[0], "end": frame.index[-1]}
+        for column in columns:
+            row[f"{column} total"] = totals[column]
+            row[f"{column} max drawdown"] = float(drawdown[column].min())
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("symbol")
+
+
+def write_report(frames, out_dir="reports", points=POINTS, processes=None, title="Backtest report"):
+    """
+    Renders every symbol's chart and writes out_dir/index.html with the
+    summary table followed by the charts. Symbols with empty backtests are
+    skipped. Returns the path of the report.
+    """
+    frames = {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+    out_dir = Path(out_dir)
+    charts = render_charts(frames, out_dir, points, processes)
+
+    table = summary_table(frames) if frames else pd.DataFrame()
+    percent = {column: "{:.2%}".format for column in table.columns if column.endswith(("total", "drawdown"))}
+    sections = [
+        f"<h2>{html.escape(symbol)}</h2>\n<img src=\"{html.escape(Path(path).name)}\" alt=\"{html.escape(symbol)}\">"
+        for symbol, path in charts.items()
+    ]
+    page = "\n".join([
+        "<!DOCTYPE html>",
+        f"<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head><body>",
+        f"<h1>{html.escape(title)}</h1>",
+        table.to_html(formatters=percent) if frames else "<p>No backtests to report.</p>",
+        *sections,
+        "</body></html>",
+    ])
+    path = out_dir / "index.html"
+    path.write_text(page)
+    return str(path)
@@ -0,0 +1,188 @@
+"""
+Universe screener for the risk tiers.
+
+get_rec recommends hand-picked tickers per risk level (SPY for low, AAPL/ROKU
+for medium, penny stocks such as EAST for high). ``screen_universe`` scans
+every symbol in a ``BarStore`` instead: bars are collapsed to exchange-local
+trading days with array reductions, and realized volatility, average dollar
+volume, overnight gap frequency and beta to SPY are computed per symbol on a
+process pool. Returns and gaps use the regular session's open and close, so
+pre-market and after-hours bars only count towards dollar volume.
+``rank_candidates`` then turns the metrics into ranked lists per risk level.
+"""
+
+### Required Libraries ###
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from algotrader.store import BAR_COLUMNS, BarStore, time_slice
+
+NS_PER_DAY = 86_400 * 10 ** 9
+NS_PER_MINUTE = 60 * 10 ** 9
+EXCHANGE_TIMEZONE = "America/New_York"
+SESSION_OPEN_MINUTE = 9 * 60 + 30
+SESSION_CLOSE_MINUTE = 16 * 60
+TRADING_DAYS = 252
+GAP_THRESHOLD = 0.02
+MIN_SESSIONS = 60
+BENCHMARK = "SPY"
+
+OPEN, HIGH, LOW, CLOSE, VOLUME, VWAP = (BAR_COLUMNS.index(name) for name in ("open", "high", "low", "close", "volume", "vwap"))
+
+# Filters per risk level and the (column, ascending) order candidates are ranked by.
+RISK_TIERS = {
+    "low": {"max_vol": 0.22, "min_dollar_volume": 5e8, "beta": (0.7, 1.3), "sort": ("realized_vol", True)},
+    "medium": {"min_vol": 0.22, "max_vol": 0.50, "min_dollar_volume": 2e7, "sort": ("avg_dollar_volume", False)},
+    "high": {"min_vol": 0.50, "min_dollar_volume": 1e5, "sort": ("realized_vol", False)},
+}
+
+
+### Per-Symbol Metrics ###
+def exchange_time(t):
+    """
+    Stored UTC nanoseconds as nanoseconds of exchange-local (New York) wall
+    time, so that day boundaries fall at local midnight.
+    """
+    index = pd.DatetimeIndex(np.asarray(t).astype("datetime64[ns]")).tz_localize("UTC")
+    return index.tz_convert(EXCHANGE_TIMEZONE).tz_localize(None).values.astype("datetime64[ns]").view(np.int64)
+
+
+def bar_minutes(t):
+    """
+    Bar length in minutes, taken as the smallest step between timestamps and
+    capped at a day (daily bars).
+    """
+    steps = np.diff(np.asarray(t))
+    steps = steps[steps > 0]
+    return int(min(steps.min() // NS_PER_MINUTE, 24 * 60)) if len(steps) else 1
+
+
+def sessions(bars, t):
+    """
+    Collapses bars to one row per exchange-local trading day: the day number,
+    the open of the first and the close of the last regular-session bar, and
+    the dollar volume traded over the whole day, extended hours included.
+    Days without a regular-session bar are left out.
+    """
+    local = exchange_time(t)
+    day = local // NS_PER_DAY
+    minute = (local % NS_PER_DAY) // NS_PER_MINUTE
+    regular = (minute < SESSION_CLOSE_MINUTE) & (minute + bar_minutes(t) > SESSION_OPEN_MINUTE)
+
+    starts = np.flatnonzero(np.r_[True, np.diff(day) != 0])
+    dollar_volume = np.add.reduceat(bars[:, VWAP] * bars[:, VOLUME], starts) if len(day) else np.empty(0)
+
+    regular_day, regular_bars = day[regular], bars[regular]
+    first = np.flatnonzero(np.r_[True, np.diff(regular_day) != 0]) if len(regular_day) else np.empty(0, dtype=int)
+    last = np.r_[first[1:], len(regular_day)] - 1
+    days = regular_day[first]
+    return days, regular_bars[first, OPEN], regular_bars[last, CLOSE], dollar_volume[np.searchsorted(day[starts], days)]
+
+
+def symbol_metrics(bars, t, benchmark_days=None, benchmark_returns=None):
+    """
+    Screening metrics for one symbol's bars, or None when there are fewer than
+    MIN_SESSIONS trading days.
+    """
+    days, opens, closes, dollar_volume = sessions(np.asarray(bars), t)
+    if len(days) < MIN_SESSIONS:
+        return None
+    returns = np.diff(np.log(closes))
+    gaps = np.abs(opens[1:] / closes[:-1] - 1)
+
+    beta = np.nan
+    if benchmark_days is not None:
+        _, mine, theirs = np.intersect1d(days[1:], benchmark_days, assume_unique=True, return_indices=True)
+        if len(mine) >= MIN_SESSIONS:
+            x, y = benchmark_returns[theirs], returns[mine]
+            variance = np.var(x)
+            if variance > 0:
+                beta = float(np.mean((x - x.mean()) * (y - y.mean())) / variance)
+
+    return {
+        "realized_vol": float(np.std(returns) * np.sqrt(TRADING_DAYS)),
+        "avg_dollar_volume": float(np.mean(dollar_volume)),
+        "gap_frequency": float(np.mean(gaps > GAP_THRESHOLD)),
+        "beta": beta,
+        "last_close": float(closes[-1]),
+        "sessions": int(len(days)),
+    }
+
+
+def _benchmark(store, symbol, start, end):
+    """
+    Session days (excluding the first) and daily log returns of the benchmark.
+    """
+    bars, t = store.arrays(symbol)
+    lo, hi = time_slice(t, start, end)
+    days, _, closes, _ = sessions(np.asarray(bars[lo:hi]), t[lo:hi])
+    return days[1:], np.diff(np.log(closes))
+
+
+def _screen_chunk(root, symbols, benchmark, start, end):
+    """
+    Worker task: metrics for a chunk of symbols read from the bar store.
+    """
+    store = BarStore(root)
+    benchmark_days, benchmark_returns = benchmark if benchmark is not None else (None, None)
+    rows = []
+    for symbol in symbols:
+        bars, t = store.arrays(symbol)
+        lo, hi = time_slice(t, start, end)
+        metrics = symbol_metrics(bars[lo:hi], t[lo:hi], benchmark_days, benchmark_returns)
+        if metrics is not None:
+            rows.append({"symbol": symbol, **metrics})
+    return rows
+
+
+### Screening ###
+def screen_universe(store, symbols=None, benchmark=BENCHMARK, start=None, end=None, processes=None, chunk_size=64):
+    """
+    Metrics for every symbol in the store (or the given symbols) between start
+    and end, computed on a pool of processes (processes=1 runs inline).
+    Returns a DataFrame indexed by symbol.
+    """
+    symbols = symbols if symbols is not None else store.symbols()
+    reference = _benchmark(store, benchmark, start, end) if benchmark in store.symbols() else None
+    chunks = [symbols[i : i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+    processes = processes or os.cpu_count() or 1
+
+    rows = []
+    if processes == 1:
+        for chunk in chunks:
+            rows.extend(_screen_chunk(store.root, chunk, reference, start, end))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_screen_chunk, store.root, chunk, reference, start, end) for chunk in chunks]
+            for future in futures:
+                rows.extend(future.result())
+
+    columns = ["realized_vol", "avg_dollar_volume", "gap_frequency", "beta", "last_close", "sessions"]
+    if not rows:
+        return pd.DataFrame(columns=columns, index=pd.Index([], name="symbol"))
+    return pd.DataFrame(rows).set_index("symbol")[columns]
+
+
+def rank_candidates(metrics, tiers=RISK_TIERS, top=20):
+    """
+    Ranked candidate lists per risk level: the symbols passing each tier's
+    filters, best first, at most top per level.
+    """
+    candidates = {}
+    for risk_level, tier in tiers.items():
+        mask = pd.Series(True, index=metrics.index)
+        if "min_vol" in tier:
+            mask &= metrics["realized_vol"] >= tier["min_vol"]
+        if "max_vol" in tier:
+            mask &= metrics["realized_vol"] < tier["max_vol"]
+        if "min_dollar_volume" in tier:
+            mask &= metrics["avg_dollar_volume"] >= tier["min_dollar_volume"]
+        if "beta" in tier:
+            low, high = tier["beta"]
+            mask &= metrics["beta"].between(low, high)
+        column, ascending = tier["sort"]
+        candidates[risk_level] = metrics[mask].sort_values(column, ascending=ascending).head(top)
+    return candidates
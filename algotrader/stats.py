@@ -0,0 +1,199 @@
+"""
+Bootstrap confidence intervals for strategy returns.
+
+A single ``(1 + returns).cumprod()`` curve cannot tell whether 'mlp returns'
+beat 'Actual Returns' by skill or by luck. ``bootstrap_metrics`` resamples the
+return series with a circular block bootstrap (blocks keep the short-range
+autocorrelation of hourly returns) and computes Sharpe ratio, CAGR and maximum
+drawdown for thousands of resamples at once. Every metric is assembled from
+per-block statistics with array operations across all resamples, so there is
+no Python loop per resample and no (resamples x bars) array. Strategy and benchmark
+are resampled with the same indices, so the difference between them gets its
+own interval.
+"""
+
+### Required Libraries ###
+import numpy as np
+import pandas as pd
+
+N_RESAMPLES = 2000
+CONFIDENCE = 0.95
+MEMORY_LIMIT_MB = 256
+TRADING_DAYS = 252
+METRICS = ("sharpe", "cagr", "max_drawdown")
+
+
+### Helpers ###
+def periods_per_year(index):
+    """
+    Bars per year implied by a DatetimeIndex, or TRADING_DAYS when it cannot
+    be inferred.
+    """
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        years = (index[-1] - index[0]).total_seconds() / (365.25 * 86_400)
+        if years > 0:
+            return len(index) / years
+    return TRADING_DAYS
+
+
+def block_tables(values, length, memory_limit_mb=MEMORY_LIMIT_MB):
+    """
+    Statistics of every circular block of length bars in values (bars,
+    series), indexed by the block's start: sum and sum of squares of the
+    returns, total log growth, the lowest and highest point of the block's
+    cumulative log growth and its internal maximum drawdown (in log terms).
+    """
+    n, k = values.shape
+    doubled = np.concatenate([values, values[:length]])
+    windows = np.lib.stride_tricks.sliding_window_view(doubled, length, axis=0)[:n]
+    tables = {name: np.empty((n, k)) for name in ("sum", "sumsq", "log", "low", "high", "drawdown")}
+    chunk = max(1, int(memory_limit_mb * 2 ** 20 // (4 * 8 * k * length)))
+    for start in range(0, n, chunk):
+        rows = slice(start, start + chunk)
+        window = windows[rows]
+        path = np.cumsum(np.log1p(window), axis=-1)
+        peak = np.maximum.accumulate(path, axis=-1)
+        tables["sum"][rows] = window.sum(axis=-1)
+        tables["sumsq"][rows] = (window ** 2).sum(axis=-1)
+        tables["log"][rows] = path[..., -1]
+        tables["low"][rows] = path.min(axis=-1)
+        tables["high"][rows] = peak[..., -1]
+        tables["drawdown"][rows] = (path - peak).min(axis=-1)
+    return tables
+
+
+def performance(returns, periods):
+    """
+    Sharpe ratio, CAGR and maximum drawdown along axis 1 of an array of
+    returns shaped (resamples, bars, series); each result is (resamples, series).
+    """
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods), np.nan)
+    log_growth = np.cumsum(np.log1p(returns), axis=1)
+    cagr = np.expm1(log_growth[:, -1] * periods / returns.shape[1])
+    drawdown = np.expm1(log_growth - np.maximum.accumulate(log_growth, axis=1))
+    return {"sharpe": sharpe, "cagr": cagr, "max_drawdown": drawdown.min(axis=1)}
+
+
+def interval(samples, confidence=CONFIDENCE):
+    """
+    Equal-tailed percentile interval over the finite samples, or (nan, nan)
+    when there are none (e.g. the Sharpe ratio of a strategy that never
+    trades).
+    """
+    samples = samples[np.isfinite(samples)]
+    if not len(samples):
+        return np.nan, np.nan
+    tail = (1 - confidence) / 2
+    lower, upper = np.quantile(samples, [tail, 1 - tail])
+    return float(lower), float(upper)
+
+
+### Bootstrap ###
+def bootstrap_distribution(returns, n_resamples=N_RESAMPLES, block_length=None, periods=None, seed=0, memory_limit_mb=MEMORY_LIMIT_MB):
+    """
+    Circular block bootstrap distribution of every metric for each column of a
+    returns DataFrame: a dict of metric -> (n_resamples, columns) array.
+
+    A resample is a sequence of blocks, so its metrics follow from per-block
+    statistics (block_tables) combined block by block for all resamples at
+    once. Drawdowns carry the running peak across blocks, so the result is the
+    same as materializing each resampled series, at a fraction of the cost.
+    """
+    values = np.nan_to_num(returns.to_numpy(dtype=float))
+    n, k = values.shape
+    block_length = min(block_length or max(1, int(round(n ** (1 / 3)))), n)
+    periods = periods or periods_per_year(returns.index)
+    rng = np.random.default_rng(seed)
+
+    n_blocks = -(-n // block_length)
+    last_length = n - (n_blocks - 1) * block_length
+    full = block_tables(values, block_length, memory_limit_mb)
+    last = full if last_length == block_length else block_tables(values, last_length, memory_limit_mb)
+    starts = rng.integers(0, n, size=(n_resamples, n_blocks))
+
+    level = np.zeros((n_resamples, k))
+    peak = np.full((n_resamples, k), -np.inf)
+    drawdown = np.zeros((n_resamples, k))
+    total = np.zeros((n_resamples, k))
+    total_squares = np.zeros((n_resamples, k))
+    for block in range(n_blocks):
+        tables = last if block == n_blocks - 1 else full
+        start = starts[:, block]
+        drawdown = np.minimum(drawdown, np.minimum(level - peak + tables["low"][start], tables["drawdown"][start]))
+        peak = np.maximum(peak, level + tables["high"][start])
+        level += tables["log"][start]
+        total += tables["sum"][start]
+        total_squares += tables["sumsq"][start]
+
+    mean = total / n
+    std = np.sqrt(np.maximum(total_squares / n - mean ** 2, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods), np.nan)
+    return {"sharpe": sharpe, "cagr": np.expm1(level * periods / n), "max_drawdown": np.expm1(drawdown)}
+
+
+def bootstrap_metrics(returns, n_resamples=N_RESAMPLES, confidence=CONFIDENCE, block_length=None, seed=0, memory_limit_mb=MEMORY_LIMIT_MB):
+    """
+    Point estimates and bootstrap confidence intervals of Sharpe, CAGR and max
+    drawdown for each column of a returns DataFrame. Returns a DataFrame
+    indexed by (series, metric) with estimate, lower and upper columns.
+    """
+    periods = periods_per_year(returns.index)
+    point = performance(np.nan_to_num(returns.to_numpy(dtype=float))[None], periods)
+    distribution = bootstrap_distribution(returns, n_resamples, block_length, periods, seed, memory_limit_mb)
+    rows = []
+    for j, column in enumerate(returns.columns):
+        for metric in METRICS:
+            lower, upper = interval(distribution[metric][:, j], confidence)
+            rows.append({"series": column, "metric": metric, "estimate": point[metric][0, j], "lower": lower, "upper": upper})
+    return pd.DataFrame(rows).set_index(["series", "metric"])
+
+
+def compare_strategy(
+    frame,
+    strategy="mlp returns",
+    benchmark="Actual Returns",
+    n_resamples=N_RESAMPLES,
+    confidence=CONFIDENCE,
+    block_length=None,
+    seed=0,
+    memory_limit_mb=MEMORY_LIMIT_MB,
+):
+    """
+    Confidence intervals for a strategy, its benchmark and their difference
+    (strategy minus benchmark, from paired resamples). The 'p_not_better'
+    column is the share of resamples in which the strategy did not beat the
+    benchmark on that metric, among the resamples where the difference is
+    defined; it is NaN when it is defined in none of them.
+    """
+    returns = frame[[strategy, benchmark]]
+    periods = periods_per_year(returns.index)
+    point = performance(np.nan_to_num(returns.to_numpy(dtype=float))[None], periods)
+    distribution = bootstrap_distribution(returns, n_resamples, block_length, periods, seed, memory_limit_mb)
+
+    rows = []
+    for metric in METRICS:
+        series = {
+            strategy: (point[metric][0, 0], distribution[metric][:, 0]),
+            benchmark: (point[metric][0, 1], distribution[metric][:, 1]),
+            "difference": (point[metric][0, 0] - point[metric][0, 1], distribution[metric][:, 0] - distribution[metric][:, 1]),
+        }
+        for name, (estimate, samples) in series.items():
+            lower, upper = interval(samples, confidence)
+            row = {"series": name, "metric": metric, "estimate": estimate, "lower": lower, "upper": upper}
+            if name == "difference":
+                defined = samples[np.isfinite(samples)]
+                row["p_not_better"] = float(np.mean(defined <= 0)) if len(defined) else np.nan
+            rows.append(row)
+    return pd.DataFrame(rows).set_index(["series", "metric"])
+
+
+def compare_symbols(frames, **kwargs):
+    """
+    compare_strategy for every symbol's backtest frame, stacked into one
+    DataFrame indexed by (symbol, series, metric).
+    """
+    return pd.concat({symbol: compare_strategy(frame, **kwargs) for symbol, frame in frames.items()}, names=["symbol"])
@@ -0,0 +1,241 @@
+"""
+On-disk bar and feature stores.
+
+``FeatureStore`` gives each symbol a directory of append-only parts. A part is
+three ``.npy`` files (features, targets and int64 UTC timestamps) that are
+opened with ``mmap_mode='r'``, so readers only page in the rows they touch:
+
+    <root>/<SYMBOL>/meta.json
+    <root>/<SYMBOL>/00000.X.npy, 00000.y.npy, 00000.t.npy, ...
+
+``BarStore`` keeps the raw bars of each symbol the same way, as one float
+matrix of BAR_COLUMNS and its timestamps, so a whole universe can be scanned
+without going back to the market-data API.
+"""
+
+### Required Libraries ###
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algotrader.features import FEATURE_COLUMNS
+from algotrader.labels import HORIZONS, THRESHOLDS, make_labeled_dataset
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume", "vwap"]
+
+
+def _write_json(path, payload):
+    temporary = path.with_suffix(".json.tmp")
+    temporary.write_text(json.dumps(payload, indent=2))
+    os.replace(temporary, path)
+
+
+def _epoch_index(index):
+    """
+    int64 UTC nanoseconds for a DatetimeIndex, and its timezone name.
+    """
+    index = pd.DatetimeIndex(index)
+    tz = None
+    if index.tz is not None:
+        tz = str(index.tz)
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.values.astype("datetime64[ns]").view(np.int64), tz
+
+
+def _datetime_index(t, tz):
+    index = pd.DatetimeIndex(np.asarray(t).astype("datetime64[ns]"))
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return index
+
+
+class FeatureStore:
+    """
+    Feature matrices and targets per symbol, stored as memory-mapped parts.
+    """
+
+    def __init__(self, root="feature_store"):
+        self.root = Path(root)
+
+    ### Metadata ###
+    def symbols(self):
+        """
+        Symbols with at least one stored part.
+        """
+        if not self.root.exists():
+            return []
+        return sorted(path.parent.name for path in self.root.glob("*/meta.json"))
+
+    def meta(self, symbol):
+        """
+        Column names and part list for a symbol.
+        """
+        path = self.root / symbol.upper() / "meta.json"
+        if not path.exists():
+            raise FileNotFoundError(f"No stored features for {symbol.upper()} under {self.root}")
+        return json.loads(path.read_text())
+
+    def n_rows(self, symbol):
+        return sum(part["rows"] for part in self.meta(symbol)["parts"])
+
+    def time_range(self, symbol):
+        """
+        First and last stored timestamps for a symbol.
+        """
+        meta = self.meta(symbol)
+        stamps = [t for _, _, t in self.parts(symbol) if len(t)]
+        if not stamps:
+            raise FileNotFoundError(f"No stored rows for {symbol.upper()} under {self.root}")
+        index = _datetime_index(np.array([stamps[0][0], stamps[-1][-1]]), meta["tz"])
+        return index[0], index[-1]
+
+    def _write_meta(self, symbol, meta):
+        _write_json(self.root / symbol.upper() / "meta.json", meta)
+
+    ### Writing ###
+    def write(self, symbol, X, y, append=False):
+        """
+        Stores the feature frame X and the target Series/DataFrame y (sharing
+        X's DatetimeIndex) as a new part. Without append, existing parts for
+        the symbol are replaced.
+        """
+        symbol = symbol.upper()
+        y = y.to_frame() if isinstance(y, pd.Series) else y
+        if not X.index.equals(y.index):
+            raise ValueError("X and y must share the same index")
+        directory = self.root / symbol
+        directory.mkdir(parents=True, exist_ok=True)
+
+        meta = None
+        if append and (directory / "meta.json").exists():
+            meta = self.meta(symbol)
+            if meta["features"] != list(X.columns) or meta["targets"] != list(y.columns):
+                raise ValueError(f"Columns do not match the stored parts for {symbol}")
+        if meta is None:
+            for path in directory.glob("*.npy"):
+                path.unlink()
+            meta = {"features": list(X.columns), "targets": list(y.columns), "tz": None, "parts": []}
+
+        t, tz = _epoch_index(X.index)
+        meta["tz"] = tz or meta["tz"]
+        name = f"{len(meta['parts']):05d}"
+        np.save(directory / f"{name}.X.npy", X.to_numpy(dtype=np.float64))
+        np.save(directory / f"{name}.y.npy", y.to_numpy(dtype=np.float64))
+        np.save(directory / f"{name}.t.npy", t)
+        meta["parts"].append({"name": name, "rows": len(X)})
+        self._write_meta(symbol, meta)
+        return name
+
+    ### Reading ###
+    def parts(self, symbol):
+        """
+        Memory-mapped (X, y, t) arrays for every part of a symbol, in order.
+        """
+        directory = self.root / symbol.upper()
+        return [
+            tuple(np.load(directory / f"{part['name']}.{kind}.npy", mmap_mode="r") for kind in ("X", "y", "t"))
+            for part in self.meta(symbol)["parts"]
+        ]
+
+    def read(self, symbol, start=None, end=None):
+        """
+        Loads a symbol's rows between start and end (inclusive) into memory as
+        (X, y) DataFrames. Meant for single symbols; use the streaming reader
+        for anything larger than RAM.
+        """
+        meta = self.meta(symbol)
+        frames_X, frames_y = [], []
+        for X, y, t in self.parts(symbol):
+            lo, hi = time_slice(t, start, end)
+            index = _datetime_index(t[lo:hi], meta["tz"])
+            frames_X.append(pd.DataFrame(np.asarray(X[lo:hi]), index=index, columns=meta["features"]))
+            frames_y.append(pd.DataFrame(np.asarray(y[lo:hi]), index=index, columns=meta["targets"]))
+        if not frames_X:
+            raise FileNotFoundError(f"No stored features for {symbol.upper()} under {self.root}")
+        return pd.concat(frames_X), pd.concat(frames_y)
+
+
+class BarStore:
+    """
+    Raw bars per symbol:
+
+        <root>/<SYMBOL>/meta.json, bars.npy (rows x BAR_COLUMNS), t.npy
+    """
+
+    def __init__(self, root="bar_store"):
+        self.root = Path(root)
+
+    def symbols(self):
+        """
+        Symbols with stored bars.
+        """
+        if not self.root.exists():
+            return []
+        return sorted(path.parent.name for path in self.root.glob("*/meta.json"))
+
+    def write(self, symbol, bars):
+        """
+        Replaces a symbol's stored bars with the BAR_COLUMNS of a bars frame.
+        """
+        directory = self.root / symbol.upper()
+        directory.mkdir(parents=True, exist_ok=True)
+        t, tz = _epoch_index(bars.index)
+        np.save(directory / "bars.npy", bars[BAR_COLUMNS].to_numpy(dtype=np.float64))
+        np.save(directory / "t.npy", t)
+        _write_json(directory / "meta.json", {"columns": BAR_COLUMNS, "tz": tz, "rows": len(bars)})
+
+    def arrays(self, symbol):
+        """
+        Memory-mapped (bars, t) arrays for a symbol.
+        """
+        directory = self.root / symbol.upper()
+        if not (directory / "meta.json").exists():
+            raise FileNotFoundError(f"No stored bars for {symbol.upper()} under {self.root}")
+        return np.load(directory / "bars.npy", mmap_mode="r"), np.load(directory / "t.npy", mmap_mode="r")
+
+    def read(self, symbol, start=None, end=None):
+        """
+        A symbol's bars between start and end (inclusive) as a DataFrame,
+        shaped like the frames returned by get_bars.
+        """
+        meta = json.loads((self.root / symbol.upper() / "meta.json").read_text())
+        bars, t = self.arrays(symbol)
+        lo, hi = time_slice(t, start, end)
+        frame = pd.DataFrame(np.asarray(bars[lo:hi]), index=_datetime_index(t[lo:hi], meta["tz"]), columns=meta["columns"])
+        frame.index.name = "timestamp"
+        return frame
+
+
+def write_features(store, symbol, bars, horizons=HORIZONS, thresholds=THRESHOLDS, features=FEATURE_COLUMNS, append=False):
+    """
+    Computes the features (by default every model input) and the momentum
+    labels and forward returns for each horizon from a symbol's bars, and
+    writes them to the store. Every row with complete features is stored;
+    labels whose horizon runs past the last bar are stored as NaN, and the
+    readers of each target skip them.
+    """
+    X, Y = make_labeled_dataset(bars, features, horizons, thresholds)
+    return store.write(symbol, X, Y, append=append)
+
+
+def to_epoch_ns(value):
+    """
+    int64 nanoseconds since the epoch (UTC) for a timestamp-like value; naive
+    values are taken as UTC.
+    """
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return int(timestamp.to_datetime64().astype("datetime64[ns]").view(np.int64))
+
+
+def time_slice(t, start=None, end=None):
+    """
+    (lo, hi) row bounds of the sorted timestamp array t within [start, end].
+    """
+    lo = 0 if start is None else int(np.searchsorted(t, to_epoch_ns(start), side="left"))
+    hi = len(t) if end is None else int(np.searchsorted(t, to_epoch_ns(end), side="right"))
+    return lo, max(lo, hi)
@@ -0,0 +1,259 @@
+"""
+Out-of-core mini-batch training.
+
+Rows are streamed from the memory-mapped parts of a ``FeatureStore`` instead of
+being materialized as X_train/y_train frames. Rows are read in contiguous
+chunks, the chunks of all symbols are visited in random order, and each
+bounded shuffle buffer is permuted before it is cut into mini-batches for
+``partial_fit``. The buffer size follows from ``memory_limit_mb``.
+"""
+
+### Required Libraries ###
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import VotingClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from algotrader.labels import label_name
+from algotrader.models import build_model, get_config, training_window
+from algotrader.online import STOCHASTIC_SOLVERS, make_artifact
+from algotrader.store import time_slice
+
+DEFAULT_TARGET = label_name(1)
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_MEMORY_LIMIT_MB = 256
+CHUNKS_PER_BUFFER = 8
+# The chunks being collected, the concatenated buffer and its permuted copy.
+BUFFER_COPIES = 3
+
+
+### Buffer Sizing ###
+def buffer_rows_for(n_columns, batch_size=DEFAULT_BATCH_SIZE, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB):
+    """
+    Largest shuffle buffer (in rows) that stays under the memory ceiling.
+    """
+    row_bytes = 8 * n_columns
+    rows = int(memory_limit_mb * 2 ** 20 // (BUFFER_COPIES * row_bytes))
+    if rows < batch_size:
+        raise ValueError(f"memory_limit_mb={memory_limit_mb} cannot hold a single batch of {batch_size} rows")
+    return rows
+
+
+def _columns(store, symbol, features, target):
+    meta = store.meta(symbol)
+    missing = [name for name in features if name not in meta["features"]]
+    if missing or target not in meta["targets"]:
+        raise ValueError(f"{symbol.upper()} has no stored column(s) {missing or [target]}")
+    return [meta["features"].index(name) for name in features], meta["targets"].index(target)
+
+
+### Streaming Readers ###
+def iter_chunks(store, symbols, features, target=DEFAULT_TARGET, chunk_rows=65536, start=None, end=None, rng=None):
+    """
+    Yields (X, y) chunks of at most chunk_rows contiguous rows, without the
+    rows whose target is not available (NaN). With an rng the chunks of all
+    symbols are visited in random order.
+    """
+    chunks = []
+    for symbol in symbols:
+        feature_columns, target_column = _columns(store, symbol, features, target)
+        for X, y, t in store.parts(symbol):
+            lo, hi = time_slice(t, start, end)
+            for chunk_start in range(lo, hi, chunk_rows):
+                chunks.append((X, y, feature_columns, target_column, chunk_start, min(chunk_start + chunk_rows, hi)))
+    if rng is not None:
+        rng.shuffle(chunks)
+    for X, y, feature_columns, target_column, lo, hi in chunks:
+        targets = np.asarray(y[lo:hi, target_column])
+        labeled = ~np.isnan(targets)
+        if labeled.any():
+            yield np.asarray(X[lo:hi][:, feature_columns])[labeled], targets[labeled]
+
+
+def iter_minibatches(
+    store,
+    symbols,
+    features,
+    target=DEFAULT_TARGET,
+    batch_size=DEFAULT_BATCH_SIZE,
+    memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB,
+    start=None,
+    end=None,
+    seed=0,
+):
+    """
+    Yields shuffled (X, y) mini-batches over the stored rows of symbols whose
+    timestamps fall within [start, end]. Rows are shuffled within buffers of
+    buffer_rows_for(...) rows, so memory stays bounded however large the
+    store is.
+    """
+    rng = np.random.default_rng(seed)
+    buffer_rows = buffer_rows_for(len(features) + 1, batch_size, memory_limit_mb)
+    chunk_rows = max(batch_size, buffer_rows // CHUNKS_PER_BUFFER)
+
+    pending_X, pending_y, pending_rows = [], [], 0
+    chunks = iter_chunks(store, symbols, features, target, chunk_rows, start, end, rng)
+    exhausted = False
+    while not exhausted:
+        for X, y in chunks:
+            pending_X.append(X)
+            pending_y.append(y)
+            pending_rows += len(y)
+            if pending_rows >= buffer_rows:
+                break
+        else:
+            exhausted = True
+        if not pending_rows:
+            break
+
+        order = rng.permutation(pending_rows)
+        X = np.concatenate(pending_X)[order]
+        y = np.concatenate(pending_y)[order]
+        usable = pending_rows if exhausted else pending_rows - pending_rows % batch_size
+        for batch_start in range(0, usable, batch_size):
+            yield X[batch_start : batch_start + batch_size], y[batch_start : batch_start + batch_size]
+        pending_X, pending_y = [X[usable:]], [y[usable:]]
+        pending_rows -= usable
+
+
+def fit_scaler_streaming(store, symbols, features, target=DEFAULT_TARGET, start=None, end=None, chunk_rows=65536):
+    """
+    StandardScaler fitted with partial_fit over the stored rows that have a
+    `target` label, one chunk at a time, i.e. the rows the model trains on.
+    """
+    scaler = StandardScaler()
+    for X, _ in iter_chunks(store, symbols, features, target, chunk_rows, start, end):
+        scaler.partial_fit(X)
+    return scaler
+
+
+def score_streaming(model, store, symbol, features, target=DEFAULT_TARGET, scaler=None, start=None, end=None, chunk_rows=65536):
+    """
+    Accuracy of a fitted model over the stored rows of a symbol within
+    [start, end], predicted one chunk at a time, and the number of rows
+    scored. The accuracy is None when there are no rows.
+    """
+    correct = rows = 0
+    for X, y in iter_chunks(store, [symbol], features, target, chunk_rows, start, end):
+        if scaler is not None:
+            X = scaler.transform(X)
+        correct += int(np.sum(model.predict(X) == y))
+        rows += len(y)
+    return (correct / rows if rows else None), rows
+
+
+### Training ###
+def fit_streaming(estimators, batches, classes=(0, 1), scaler=None):
+    """
+    Runs partial_fit of every estimator on each mini-batch and reports the
+    throughput in rows per second.
+    """
+    classes = np.asarray(classes)
+    rows = n_batches = 0
+    started = time.perf_counter()
+    for X, y in batches:
+        if scaler is not None:
+            X = scaler.transform(X)
+        for estimator in estimators:
+            estimator.partial_fit(X, y, classes=classes)
+        rows += len(y)
+        n_batches += 1
+    seconds = time.perf_counter() - started
+    return {
+        "rows": rows,
+        "batches": n_batches,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else float("inf"),
+    }
+
+
+def _streaming_members(model):
+    """
+    Unfitted estimators to train batch by batch: clones of a voting ensemble's
+    members, or the model itself. lbfgs cannot learn from mini-batches, so
+    lbfgs networks are switched to adam.
+    """
+    members = [clone(estimator) for _, estimator in model.estimators] if isinstance(model, VotingClassifier) else [model]
+    for member in members:
+        if member.solver not in STOCHASTIC_SOLVERS:
+            member.set_params(solver="adam")
+    return members
+
+
+def _assemble_voting(model, members, classes):
+    """
+    Fills in the fitted state of a VotingClassifier whose members were trained
+    outside of its fit().
+    """
+    model.le_ = LabelEncoder().fit(classes)
+    model.classes_ = model.le_.classes_
+    model.estimators_ = members
+    model.named_estimators_ = {name: member for (name, _), member in zip(model.estimators, members)}
+    return model
+
+
+def train_streaming(
+    store,
+    symbol,
+    epochs=1,
+    batch_size=DEFAULT_BATCH_SIZE,
+    memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB,
+    training_symbols=None,
+    target=DEFAULT_TARGET,
+    seed=0,
+):
+    """
+    Trains a symbol's configured model from the feature store without loading
+    its history into memory. training_symbols pools rows from several symbols
+    into the one model (default: just the symbol) and target picks the stored
+    label to learn, e.g. label_name(8) for the 8-bar horizon. As in
+    train_full, the stored rows after the training window are streamed
+    through the model to set the baseline accuracy. Returns the artifact,
+    ready for online updates, and a throughput report. Raises ValueError when
+    the store has no rows in the training window.
+    """
+    config = get_config(symbol)
+    features = config["features"]
+    training_symbols = training_symbols or [symbol]
+    first, last = store.time_range(symbol)
+    training_begin, training_end = training_window(symbol, pd.DatetimeIndex([first]))
+
+    scaler = fit_scaler_streaming(store, training_symbols, features, target, training_begin, training_end)
+    if np.max(getattr(scaler, "n_samples_seen_", 0)) == 0:
+        raise ValueError(
+            f"No stored rows of {', '.join(training_symbols)} labeled {target!r} fall in {symbol}'s "
+            f"training window {training_begin} to {training_end}"
+        )
+    model = build_model(symbol)
+    members = _streaming_members(model)
+    classes = np.array([0, 1])
+
+    report = {"rows": 0, "batches": 0, "seconds": 0.0}
+    for epoch in range(epochs):
+        batches = iter_minibatches(
+            store, training_symbols, features, target,
+            batch_size=batch_size, memory_limit_mb=memory_limit_mb,
+            start=training_begin, end=training_end, seed=seed + epoch,
+        )
+        epoch_report = fit_streaming(members, batches, classes, scaler if config["scaled"] else None)
+        for key in report:
+            report[key] += epoch_report[key]
+    report["rows_per_second"] = report["rows"] / report["seconds"] if report["seconds"] > 0 else float("inf")
+    report["buffer_rows"] = buffer_rows_for(len(features) + 1, batch_size, memory_limit_mb)
+
+    if isinstance(model, VotingClassifier):
+        model = _assemble_voting(model, members, classes)
+    baseline_accuracy, test_rows = score_streaming(
+        model, store, symbol, features, target, scaler if config["scaled"] else None,
+        start=training_end + pd.Timedelta(1, "ns"),
+    )
+    report["test_rows"] = test_rows
+    report["baseline_accuracy"] = baseline_accuracy
+
+    rows_seen = report["rows"] // max(epochs, 1)
+    artifact = make_artifact(symbol, model, scaler, rows_seen, last if test_rows else min(last, training_end))
+    artifact["baseline_accuracy"] = baseline_accuracy
+    return artifact, report
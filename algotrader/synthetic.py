@@ -0,0 +1,523 @@
+"""
+Offline stand-in for the Alpaca market-data API.
+
+``SyntheticREST`` exposes the same ``get_bars(symbol, timeframe, start).df``
+contract the notebooks use with ``tradeapi.REST``, but every bar is generated
+locally. Prices follow a regime-switching geometric Brownian motion driven by a
+shared market factor (so SPY behaves like the market and every other name has a
+beta to it), with Poisson jumps that are frequent and large for penny-stock
+names such as EAST. Log prices revert slowly to a trend line, fast for penny
+names, so no path drifts to zero or explodes over the 2013-2030 horizon. Each
+session is simulated minute by minute with a U-shaped volume profile and then
+aggregated, so OHLC, volume and vwap agree across timeframes. Sessions are
+generated and aggregated one block of days at a time, so a request for years
+of hourly bars never holds more than a block of minutes in memory.
+
+Like Alpaca's intraday bars, the day runs from the 04:00 ET pre-market to the
+20:00 ET close of after-hours trading, so hourly requests return about 16 bars
+per day. Extended-hours minutes are thin (a few percent of the day's volume,
+so thin names have hours without a single trade) and carry part of the
+overnight gap. Daily bars cover the regular session only. Trading days follow
+the NYSE holiday calendar (NYSEHolidayCalendar); early closes are not modeled,
+so the sessions before July 4th, after Thanksgiving and on Christmas Eve run
+to 16:00.
+
+Nothing is generated until a symbol is requested, and everything is derived
+from the seed and the symbol, so the same request always returns the same bars.
+"""
+
+### Required Libraries ###
+import re
+import zlib
+from functools import lru_cache
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+### Simulation Constants ###
+TIMEZONE = "America/New_York"
+EPOCH = "2013-01-01"
+HORIZON = "2030-12-31"
+SESSION_OPEN_MINUTE = 9 * 60 + 30
+SESSION_MINUTES = 390
+PREMARKET_OPEN_MINUTE = 4 * 60
+PREMARKET_MINUTES = 330
+AFTER_HOURS_MINUTES = 240
+DAY_MINUTES = PREMARKET_MINUTES + SESSION_MINUTES + AFTER_HOURS_MINUTES
+REGULAR = slice(PREMARKET_MINUTES, PREMARKET_MINUTES + SESSION_MINUTES)
+TRADING_DAYS = 252
+LOT_SIZE = 100
+MARKET_KEY = 0x5350590A
+BLOCK_DAYS = 64
+
+# Regime switching: daily transition probabilities and volatility multipliers.
+CALM_TO_TURBULENT = 0.02
+TURBULENT_TO_CALM = 0.10
+CALM_VOL = 0.8
+TURBULENT_VOL = 2.0
+MARKET_DRIFT = 0.09
+MARKET_VOL = 0.16
+
+# Extended hours: share of the day's volume traded before the open and after
+# the close, share of the daily variance spread over those minutes, and the
+# share of the next overnight gap that is already priced in after hours.
+PREMARKET_VOLUME = 0.03
+AFTER_HOURS_VOLUME = 0.02
+EXTENDED_VARIANCE = 0.15
+AFTER_HOURS_GAP = 0.4
+
+# Unscheduled NYSE closures in the simulated range (national days of mourning).
+SPECIAL_CLOSURES = ["2018-12-05", "2025-01-09"]
+
+# Hand-tuned profiles for the tickers the bot recommends; every other symbol
+# gets a random profile drawn from its own seed. drift is the yearly growth of
+# the trend line and reversion the yearly speed at which log prices return to it.
+KNOWN_PROFILES = {
+    "SPY": {"price": 146.0, "drift": 0.10, "vol": 0.16, "beta": 1.0, "jump_rate": 1.0, "jump_scale": 0.02, "adv": 8e7, "reversion": 0.1, "penny": False},
+    "AAPL": {"price": 19.0, "drift": 0.25, "vol": 0.28, "beta": 1.2, "jump_rate": 4.0, "jump_scale": 0.05, "adv": 1e8, "reversion": 0.15, "penny": False},
+    "ROKU": {"price": 15.0, "drift": 0.20, "vol": 0.55, "beta": 1.6, "jump_rate": 6.0, "jump_scale": 0.10, "adv": 5e6, "reversion": 0.25, "penny": False},
+    "EAST": {"price": 2.5, "drift": -0.03, "vol": 0.95, "beta": 0.6, "jump_rate": 20.0, "jump_scale": 0.18, "adv": 2e5, "reversion": 0.8, "penny": True},
+}
+
+TIMEFRAME_PATTERN = re.compile(r"^\s*(\d*)\s*(min|minute|t|h|hour|d|day)\s*$", re.IGNORECASE)
+TIMEFRAME_MINUTES = {"min": 1, "minute": 1, "t": 1, "h": 60, "hour": 60, "d": SESSION_MINUTES, "day": SESSION_MINUTES}
+
+
+### Helper Functions ###
+def parse_timeframe(timeframe):
+    """
+    Converts an Alpaca timeframe ('1Min', '15Min', '1H', '1Hour', '1Day' or a
+    TimeFrame object) into a bar length in minutes, or None for daily bars.
+    """
+    match = TIMEFRAME_PATTERN.match(str(timeframe))
+    if match is None:
+        raise ValueError(f"Unsupported timeframe: {timeframe!r}")
+    amount = int(match.group(1) or 1)
+    unit = match.group(2).lower()
+    if unit in ("d", "day"):
+        if amount != 1:
+            raise ValueError(f"Only single-day bars are supported, got {timeframe!r}")
+        return None
+    minutes = amount * TIMEFRAME_MINUTES[unit]
+    if not 0 < minutes <= SESSION_MINUTES:
+        raise ValueError(f"Timeframe {timeframe!r} is longer than a trading session")
+    return minutes
+
+
+def symbol_key(symbol):
+    """
+    Stable integer derived from a ticker, used to seed its random streams.
+    """
+    return zlib.crc32(symbol.upper().encode("utf-8"))
+
+
+def synthetic_ticker(i):
+    """
+    Deterministic four-letter ticker for the i-th generated symbol.
+    """
+    letters = []
+    n = i + 26 ** 3
+    for _ in range(4):
+        n, r = divmod(n, 26)
+        letters.append(chr(ord("A") + r))
+    return "".join(reversed(letters))
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """
+    Full-day NYSE holidays: New Year's Day (not observed on a Friday), Martin
+    Luther King Jr. Day, Presidents' Day, Good Friday, Memorial Day, Juneteenth
+    (from 2022), Independence Day, Labor Day, Thanksgiving and Christmas.
+    """
+
+    rules = [
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-06-19", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+def trading_days(start=EPOCH, end=HORIZON):
+    """
+    NYSE trading days between start and end (naive dates).
+    """
+    closed = NYSEHolidayCalendar().holidays(start, end).append(pd.DatetimeIndex(SPECIAL_CLOSURES))
+    return pd.bdate_range(start, end, freq="C", holidays=closed)
+
+
+def intraday_profile():
+    """
+    U-shaped weights over the regular session minutes: trading is heaviest at
+    the open and the close.
+    """
+    t = np.linspace(-1.0, 1.0, SESSION_MINUTES)
+    weights = 1.0 + 2.5 * t ** 2
+    return weights / weights.sum()
+
+
+def day_profiles():
+    """
+    Volume and variance weights over the DAY_MINUTES from the pre-market open,
+    each summing to one. Pre-market volume builds up towards the open and
+    after-hours volume fades after the close; both are thin next to the
+    regular session.
+    """
+    regular = intraday_profile()
+    premarket = np.linspace(0.2, 1.0, PREMARKET_MINUTES)
+    after_hours = np.linspace(1.0, 0.1, AFTER_HOURS_MINUTES)
+    volume = np.concatenate([
+        PREMARKET_VOLUME * premarket / premarket.sum(),
+        (1.0 - PREMARKET_VOLUME - AFTER_HOURS_VOLUME) * regular,
+        AFTER_HOURS_VOLUME * after_hours / after_hours.sum(),
+    ])
+    extended = EXTENDED_VARIANCE / (PREMARKET_MINUTES + AFTER_HOURS_MINUTES)
+    variance = np.concatenate([
+        np.full(PREMARKET_MINUTES, extended),
+        (1.0 - EXTENDED_VARIANCE) * regular,
+        np.full(AFTER_HOURS_MINUTES, extended),
+    ])
+    return volume, variance
+
+
+### Market Data Objects ###
+class SyntheticBars:
+    """
+    Mirrors the object returned by ``REST.get_bars``: the bars are only
+    generated when ``.df`` is first accessed.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._df = None
+
+    @property
+    def df(self):
+        if self._df is None:
+            self._df = self._loader()
+        return self._df
+
+
+class SyntheticREST:
+    """
+    Drop-in replacement for ``tradeapi.REST`` for bar data.
+
+    ``universe_size`` controls how many generated symbols ``list_assets``
+    reports in addition to the known tickers; any other symbol passed to
+    ``get_bars`` is generated on demand as well. With ``extended_hours=False``
+    intraday bars are limited to the regular session; the regular-session
+    bars are the same either way.
+    """
+
+    def __init__(self, seed=0, universe_size=5000, penny_fraction=0.1, cache_size=256, extended_hours=True):
+        self.seed = seed
+        self.universe_size = universe_size
+        self.penny_fraction = penny_fraction
+        self.extended_hours = extended_hours
+        self.days = trading_days()
+        self._volume_profile, self._variance_profile = day_profiles()
+        self._daily = lru_cache(maxsize=cache_size)(self._simulate_daily)
+        self._market = None
+        self._market_shocks = lru_cache(maxsize=None)(self._market_shocks)
+
+    ### Alpaca-compatible API ###
+    def get_bars(self, symbol, timeframe, start=None, end=None, limit=None, **kwargs):
+        """
+        Returns bars for one symbol with the columns of Alpaca's v2 bars:
+        open, high, low, close, volume, trade_count and vwap, indexed by UTC
+        timestamp. Extra keyword arguments (feed, adjustment, ...) are accepted
+        and ignored.
+        """
+        minutes = parse_timeframe(timeframe)
+        return SyntheticBars(lambda: self._bars(symbol.upper(), minutes, start, end, limit))
+
+    def list_assets(self, status="active", asset_class=None):
+        """
+        Lists the symbols this source can serve, in the shape of Alpaca assets.
+        """
+        return [
+            SimpleNamespace(symbol=symbol, status="active", tradable=True, exchange="SYNTH", asset_class="us_equity")
+            for symbol in self.universe()
+        ]
+
+    def universe(self):
+        """
+        Known tickers followed by ``universe_size`` generated ones.
+        """
+        return list(KNOWN_PROFILES) + [synthetic_ticker(i) for i in range(self.universe_size)]
+
+    def profile(self, symbol):
+        """
+        Simulation parameters for a symbol: a known profile, or one drawn from
+        the symbol's own seed.
+        """
+        symbol = symbol.upper()
+        if symbol in KNOWN_PROFILES:
+            return dict(KNOWN_PROFILES[symbol])
+        rng = np.random.default_rng([self.seed, symbol_key(symbol), 1])
+        if rng.random() < self.penny_fraction:
+            return {
+                "price": float(np.clip(rng.lognormal(np.log(2.0), 0.6), 0.2, 5.0)),
+                "drift": rng.uniform(-0.1, 0.05),
+                "vol": rng.uniform(0.7, 1.5),
+                "beta": rng.uniform(0.3, 1.2),
+                "jump_rate": rng.uniform(10.0, 30.0),
+                "jump_scale": rng.uniform(0.1, 0.25),
+                "adv": rng.lognormal(np.log(3e5), 1.0),
+                "reversion": rng.uniform(0.5, 1.5),
+                "penny": True,
+            }
+        return {
+            "price": float(np.clip(rng.lognormal(np.log(50.0), 1.0), 5.0, 1000.0)),
+            "drift": rng.uniform(-0.05, 0.15),
+            "vol": rng.uniform(0.18, 0.6),
+            "beta": rng.uniform(0.6, 1.6),
+            "jump_rate": rng.uniform(1.0, 6.0),
+            "jump_scale": rng.uniform(0.03, 0.08),
+            "adv": rng.lognormal(np.log(1.5e6), 1.0),
+            "reversion": rng.uniform(0.1, 0.4),
+            "penny": False,
+        }
+
+    ### Daily Layer ###
+    def _simulate_market(self):
+        """
+        Shared market factor: daily log returns and the regime volatility
+        multiplier for every trading day between EPOCH and HORIZON.
+        """
+        if self._market is None:
+            rng = np.random.default_rng([self.seed, MARKET_KEY])
+            n = len(self.days)
+            switches = rng.random(n)
+            regime = np.empty(n)
+            turbulent = False
+            for i in range(n):
+                if turbulent:
+                    turbulent = switches[i] >= TURBULENT_TO_CALM
+                else:
+                    turbulent = switches[i] < CALM_TO_TURBULENT
+                regime[i] = TURBULENT_VOL if turbulent else CALM_VOL
+            sigma = MARKET_VOL * regime / np.sqrt(TRADING_DAYS)
+            returns = MARKET_DRIFT / TRADING_DAYS - 0.5 * sigma ** 2 + sigma * rng.standard_normal(n)
+            self._market = (returns, regime)
+        return self._market
+
+    def _simulate_daily(self, symbol):
+        """
+        Daily closes, opens, pre-market starting levels and volume levels for
+        one symbol. Cached per symbol; the intraday sessions are bridged between
+        these prices.
+        """
+        profile = self.profile(symbol)
+        market_returns, regime = self._simulate_market()
+        rng = np.random.default_rng([self.seed, symbol_key(symbol), 2])
+        n = len(self.days)
+
+        beta = profile["beta"]
+        idio_vol = np.sqrt(max(profile["vol"] ** 2 - (beta * MARKET_VOL) ** 2, (0.1 * profile["vol"]) ** 2))
+        idio = idio_vol * regime / np.sqrt(TRADING_DAYS) * rng.standard_normal(n)
+        jumps = rng.poisson(profile["jump_rate"] / TRADING_DAYS, n)
+        jump_returns = jumps * rng.normal(0.0, profile["jump_scale"], n)
+        excess_market = market_returns - MARKET_DRIFT / TRADING_DAYS
+        shocks = beta * excess_market + idio + jump_returns
+
+        # Deviation of the log price from its trend line, pulled back a little
+        # every day (an AR(1) in the shocks).
+        persistence = 1.0 - profile["reversion"] / TRADING_DAYS
+        deviation = np.empty(n)
+        level = 0.0
+        for i in range(n):
+            level = persistence * level + shocks[i]
+            deviation[i] = level
+        trend = profile["drift"] / TRADING_DAYS * np.arange(1, n + 1)
+        closes = profile["price"] * np.exp(trend + deviation)
+        log_returns = np.diff(np.log(closes), prepend=np.log(profile["price"]))
+
+        daily_sigma = profile["vol"] * regime / np.sqrt(TRADING_DAYS)
+        activity = 1.0 + 3.0 * np.abs(log_returns) / daily_sigma.mean()
+        volume = profile["adv"] * rng.lognormal(-0.045, 0.3, n) * activity / activity.mean()
+
+        # Overnight gaps: part of the move happens after hours, the rest in the
+        # pre-market, and the regular session opens at previous * exp(gap).
+        previous = np.concatenate([[profile["price"]], closes[:-1]])
+        gap = 0.3 * log_returns + 0.1 * daily_sigma * rng.standard_normal(n)
+        opens = previous * np.exp(gap)
+        overnight = previous * np.exp(AFTER_HOURS_GAP * gap)
+        return profile, closes, opens, overnight, daily_sigma, volume
+
+    ### Intraday Layer ###
+    def _market_shocks(self, block):
+        """
+        Market-wide minute shocks for one block of days, shared by every symbol
+        so intraday moves are correlated.
+        """
+        rng = np.random.default_rng([self.seed, MARKET_KEY, 3, block])
+        return rng.standard_normal((BLOCK_DAYS, DAY_MINUTES))
+
+    def _session_draws(self, key, block, daily_volume):
+        """
+        Symbol-specific random draws for one block of days: price shocks, wick
+        sizes and minute volumes.
+        """
+        rng = np.random.default_rng([self.seed, key, 3, block])
+        shape = (BLOCK_DAYS, DAY_MINUTES)
+        days = np.minimum(np.arange(block * BLOCK_DAYS, (block + 1) * BLOCK_DAYS), len(daily_volume) - 1)
+        shocks = rng.standard_normal(shape, dtype=np.float32)
+        wicks = rng.standard_exponential(shape + (2,), dtype=np.float32)
+        # Bursty minute volume, stochastically rounded to whole lots so that
+        # thin names end up with minutes (and bars) without any trades.
+        burst = 0.5 + 0.5 * rng.standard_exponential(shape, dtype=np.float32)
+        expected_lots = daily_volume[days, None] * self._volume_profile * burst / LOT_SIZE
+        volume = np.floor(expected_lots + rng.random(shape, dtype=np.float32)).astype(np.int64) * LOT_SIZE
+        return shocks, wicks, volume
+
+    def _simulate_sessions(self, symbol, day_slice):
+        """
+        Minute-level OHLCV and vwap for the requested days, as arrays shaped
+        (days, DAY_MINUTES) starting at the pre-market open.
+        """
+        profile, closes, opens, overnight, daily_sigma, daily_volume = self._daily(symbol)
+        key = symbol_key(symbol)
+        indices = np.arange(day_slice.start, day_slice.stop)
+        correlation = min(profile["beta"] * MARKET_VOL / profile["vol"], 0.95)
+        weights = self._variance_profile
+
+        # Random draws come in fixed blocks of days so that a day's bars do not
+        # depend on which range was requested.
+        first_block = day_slice.start // BLOCK_DAYS
+        last_block = -(-day_slice.stop // BLOCK_DAYS)
+        blocks = [self._session_draws(key, block, daily_volume) for block in range(first_block, last_block)]
+        rows = slice(day_slice.start - first_block * BLOCK_DAYS, day_slice.stop - first_block * BLOCK_DAYS)
+        market_shocks = np.concatenate([self._market_shocks(block) for block in range(first_block, last_block)])[rows]
+        shocks, wicks, volume = (np.concatenate([draws[i] for draws in blocks])[rows] for i in range(3))
+
+        sigma = daily_sigma[indices]
+        next_overnight = np.append(overnight, closes[-1])[indices + 1]
+
+        # Brownian bridges through the (already simulated) daily prices: from
+        # the pre-market level to the open, from the open to the close and from
+        # the close to the level the next pre-market starts from.
+        z = correlation * market_shocks + np.sqrt(1.0 - correlation ** 2) * shocks
+        steps = z * np.sqrt(weights) * sigma[:, None]
+        log_close = np.empty(steps.shape)
+        segments = [
+            (slice(0, REGULAR.start), overnight[indices], opens[indices]),
+            (REGULAR, opens[indices], closes[indices]),
+            (slice(REGULAR.stop, DAY_MINUTES), closes[indices], next_overnight),
+        ]
+        for columns, begin, finish in segments:
+            walk = np.cumsum(steps[:, columns], axis=1)
+            cumulative_weights = np.cumsum(weights[columns]) / weights[columns].sum()
+            drift = walk[:, -1:] - np.log(finish / begin)[:, None]
+            log_close[:, columns] = np.log(begin)[:, None] + walk - cumulative_weights * drift
+        log_open = np.concatenate([np.log(overnight[indices])[:, None], log_close[:, :-1]], axis=1)
+
+        minute_sigma = np.sqrt(weights) * sigma[:, None]
+        decimals = 4 if profile["penny"] else 2
+        tick = 10.0 ** -decimals
+        o = np.maximum(np.round(np.exp(log_open), decimals), tick)
+        c = np.maximum(np.round(np.exp(log_close), decimals), tick)
+        h = np.round(np.maximum(o, c) * np.exp(0.5 * minute_sigma * wicks[..., 0]), decimals)
+        lo = np.maximum(np.round(np.minimum(o, c) * np.exp(-0.5 * minute_sigma * wicks[..., 1]), decimals), tick)
+        vwap = (h + lo + c) / 3.0
+
+        trade_size = 50.0 if profile["penny"] else 150.0
+        trade_count = np.ceil(volume / trade_size)
+        return o, h, lo, c, volume, trade_count, vwap
+
+    def _bars(self, symbol, minutes, start, end, limit):
+        """
+        Generates the minute sessions covering [start, end] one block of days
+        at a time and aggregates each block into bars of the requested length,
+        so memory depends on BLOCK_DAYS rather than on the length of the range.
+        """
+        start = pd.Timestamp(start if start is not None else EPOCH)
+        end = pd.Timestamp(end) if end is not None else pd.Timestamp.now(tz=TIMEZONE)
+        start = start.tz_localize(TIMEZONE) if start.tzinfo is None else start.tz_convert(TIMEZONE)
+        end = end.tz_localize(TIMEZONE) if end.tzinfo is None else end.tz_convert(TIMEZONE)
+        first = self.days.searchsorted(start.tz_localize(None).normalize())
+        last = self.days.searchsorted(end.tz_localize(None).normalize(), side="right")
+        columns = ["open", "high", "low", "close", "volume", "trade_count", "vwap"]
+        if last <= first:
+            return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], tz="UTC", name="timestamp"))
+
+        # Daily bars cover the regular session; intraday bars the whole day
+        # unless extended hours are switched off.
+        regular_only = minutes is None or not self.extended_hours
+        if regular_only:
+            minute_of_day = SESSION_OPEN_MINUTE + np.arange(SESSION_MINUTES)
+        else:
+            minute_of_day = PREMARKET_OPEN_MINUTE + np.arange(DAY_MINUTES)
+        if minutes is None:
+            bin_minutes = np.zeros(len(minute_of_day), dtype=int)
+        else:
+            bin_minutes = (minute_of_day // minutes) * minutes
+        starts = np.flatnonzero(np.r_[True, np.diff(bin_minutes) != 0])
+        ends = np.r_[starts[1:], len(minute_of_day)] - 1
+        offsets = pd.to_timedelta(bin_minutes[starts], unit="min")
+
+        frames = []
+        rows = 0
+        block_start = first
+        while block_start < last:
+            block_stop = min((block_start // BLOCK_DAYS + 1) * BLOCK_DAYS, last)
+            sessions = self._simulate_sessions(symbol, slice(block_start, block_stop))
+            if regular_only:
+                sessions = [values[:, REGULAR] for values in sessions]
+            frame = self._aggregate(sessions, starts, ends, self.days[block_start:block_stop], offsets)
+            frame = frame[(frame["volume"] > 0) & (frame.index >= start) & (frame.index <= end)]
+            frames.append(frame)
+            rows += len(frame)
+            if limit is not None and rows >= limit:
+                break
+            block_start = block_stop
+
+        frame = pd.concat(frames)
+        frame.index.name = "timestamp"
+        frame = frame.astype({"volume": "int64", "trade_count": "int64"})
+        if limit is not None:
+            frame = frame.iloc[:limit]
+        return frame
+
+    @staticmethod
+    def _aggregate(sessions, starts, ends, days, offsets):
+        """
+        Bins minute sessions shaped (days, minutes) into bars starting at the
+        minute columns in starts and ending at those in ends.
+        """
+        o, h, lo, c, volume, trade_count, vwap = sessions
+        bar_volume = np.add.reduceat(volume, starts, axis=1)
+        traded_value = np.add.reduceat(vwap * volume, starts, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            bar_vwap = traded_value / bar_volume
+        bars = {
+            "open": o[:, starts],
+            "high": np.maximum.reduceat(h, starts, axis=1),
+            "low": np.minimum.reduceat(lo, starts, axis=1),
+            "close": c[:, ends],
+            "volume": bar_volume,
+            "trade_count": np.add.reduceat(trade_count, starts, axis=1),
+            "vwap": bar_vwap,
+        }
+        day_stamps = days.tz_localize(TIMEZONE)
+        stamps = (day_stamps.repeat(len(starts)) + np.tile(offsets, len(days))).tz_convert("UTC")
+        return pd.DataFrame({name: values.ravel() for name, values in bars.items()}, index=stamps)
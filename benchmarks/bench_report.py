@@ -0,0 +1,86 @@
+"""
+Render time of a backtest chart against the length of the backtest.
+
+Simulates hourly 'Actual Returns' / 'mlp returns' frames of growing length and
+times downsampling plus rendering one chart with algotrader.report, next to
+rendering every bar as the notebooks do. With downsampling the render time
+stays flat; only the linear-time LTTB pass grows with the series.
+
+    python benchmarks/bench_report.py
+"""
+
+### Required Libraries ###
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algotrader.report import POINTS, downsample, render_chart  # noqa: E402
+
+LENGTHS = [1_000, 10_000, 100_000, 1_000_000]
+FULL_RESOLUTION_LIMIT = 1_000_000
+REPEATS = 3
+# Rendering the longest series may take at most this multiple of the shortest.
+FLATNESS_TARGET = 2.0
+
+
+def backtest_frame(n, seed=0):
+    """
+    Random hourly backtest frame with the notebook columns.
+    """
+    rng = np.random.default_rng(seed)
+    actual = rng.normal(0.0001, 0.005, n)
+    predictions = (rng.random(n) > 0.5).astype(float)
+    index = pd.date_range("2013-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame({"Actual Returns": actual, "mlp predictions": predictions, "mlp returns": actual * predictions}, index=index)
+
+
+def full_resolution(frame):
+    """
+    Every bar of the curves, as plotting the cumprod() directly would draw.
+    """
+    return downsample(frame, points=len(frame))
+
+
+def timed(function, *args):
+    """
+    Median wall time of function(*args) and its last result.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = function(*args)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def main():
+    print(f"{'bars':>10} {'downsample':>11} {'render':>8} {'full render':>12}")
+    renders = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        render_chart("warmup", downsample(backtest_frame(100)), Path(out_dir) / "warmup.png")
+        for n in LENGTHS:
+            frame = backtest_frame(n)
+            reduce_time, reduced = timed(downsample, frame, POINTS)
+            render_time, _ = timed(render_chart, "bench", reduced, Path(out_dir) / "bench.png")
+            renders.append(render_time)
+            full = "skipped"
+            if n <= FULL_RESOLUTION_LIMIT:
+                full_time, _ = timed(render_chart, "bench", full_resolution(frame), Path(out_dir) / "full.png")
+                full = f"{full_time:.3f}s"
+            print(f"{n:>10} {reduce_time:>10.3f}s {render_time:>7.3f}s {full:>12}")
+
+    ratio = renders[-1] / renders[0]
+    print(f"render time, longest / shortest series: {ratio:.2f}x (target {FLATNESS_TARGET:.1f}x)")
+    if ratio > FLATNESS_TARGET:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
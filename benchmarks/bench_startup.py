@@ -0,0 +1,116 @@
+"""
+Startup cost of the command-line entry point.
+
+Runs ``python -m algotrader --help`` in fresh interpreters and checks it
+against STARTUP_TARGET_SECONDS, verifies that none of the heavy libraries are
+imported just to parse arguments, and reports what each subcommand's imports
+cost on top of that. The hourly ``predict`` job is checked as well: its imports
+against PREDICT_IMPORT_TARGET_SECONDS (without pulling in the training code)
+and its imports plus loading a stored model against PREDICT_TARGET_SECONDS.
+
+    python benchmarks/bench_startup.py
+"""
+
+### Required Libraries ###
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+STARTUP_TARGET_SECONDS = 0.25
+PREDICT_IMPORT_TARGET_SECONDS = 1.0
+PREDICT_TARGET_SECONDS = 2.5
+REPEATS = 5
+HEAVY_MODULES = ["pandas", "numpy", "sklearn", "finta", "matplotlib", "alpaca_trade_api", "dotenv"]
+SUBCOMMAND_IMPORTS = {
+    "fetch": "algotrader.data, algotrader.store",
+    "features": "algotrader.store",
+    "train": "algotrader.online, algotrader.store, algotrader.streaming",
+    "backtest": "algotrader.backtest, algotrader.registry, algotrader.store",
+    "predict": "algotrader.data, algotrader.features, algotrader.registry",
+    "ablate": "algotrader.ablation, algotrader.store",
+    "report": "algotrader.backtest, algotrader.registry, algotrader.report, algotrader.store",
+}
+TRAINING_MODULES = ["sklearn.ensemble", "sklearn.metrics", "algotrader.models", "algotrader.online", "algotrader.streaming"]
+
+
+def run(*args):
+    """
+    Median wall time of a fresh interpreter running args.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def loaded_modules(modules, candidates):
+    """
+    The candidates that a fresh interpreter has imported after importing modules.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys, {modules}; print(*[m for m in {candidates!r} if m in sys.modules])"],
+        cwd=REPO, check=True, capture_output=True, text=True,
+    ).stdout.split()
+
+
+def save_model(root):
+    """
+    Stores a small fitted artifact shaped like the SPY model for predict to load.
+    """
+    import numpy as np
+    from sklearn.neural_network import MLPClassifier
+    from sklearn.preprocessing import StandardScaler
+
+    from algotrader.registry import ModelRegistry
+
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(500, 3)), rng.integers(0, 2, 500)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = MLPClassifier(hidden_layer_sizes=(25, 4), max_iter=5, random_state=1).fit(X, y)
+    artifact = {
+        "symbol": "SPY", "features": ["vwap", "ema-8", "rsi"], "scaled": False, "model": model,
+        "scaler": StandardScaler().fit(X), "rows_seen": len(X), "last_timestamp": None,
+        "baseline_accuracy": None, "recent_hits": np.zeros(0, dtype=bool),
+    }
+    ModelRegistry(root).save(artifact)
+
+
+def main():
+    baseline = run("-c", "pass")
+    startup = run("-m", "algotrader", "--help")
+    print(f"interpreter:            {baseline:.3f}s")
+    print(f"algotrader --help:      {startup:.3f}s (target {STARTUP_TARGET_SECONDS:.3f}s)")
+
+    loaded = loaded_modules("algotrader.cli", HEAVY_MODULES)
+    print(f"heavy modules at startup: {', '.join(loaded) or 'none'}")
+
+    for command, modules in SUBCOMMAND_IMPORTS.items():
+        print(f"{command + ' imports:':<24}{run('-c', f'import {modules}') - baseline:.3f}s")
+
+    predict_modules = SUBCOMMAND_IMPORTS["predict"]
+    predict_imports = run("-c", f"import {predict_modules}") - baseline
+    training = loaded_modules(predict_modules, TRAINING_MODULES)
+    with tempfile.TemporaryDirectory() as root:
+        save_model(root)
+        predict = run("-c", f"import {predict_modules}; algotrader.registry.ModelRegistry({root!r}).load('SPY')") - baseline
+    print(f"predict imports:        {predict_imports:.3f}s (target {PREDICT_IMPORT_TARGET_SECONDS:.3f}s)")
+    print(f"predict + model load:   {predict:.3f}s (target {PREDICT_TARGET_SECONDS:.3f}s)")
+    print(f"training modules in predict: {', '.join(training) or 'none'}")
+
+    if startup > STARTUP_TARGET_SECONDS or loaded:
+        sys.exit(1)
+    if predict_imports > PREDICT_IMPORT_TARGET_SECONDS or predict > PREDICT_TARGET_SECONDS or training:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()